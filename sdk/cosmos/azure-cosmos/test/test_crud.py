@@ -12,6 +12,9 @@ import time
 import unittest
 import urllib.parse as urllib
 import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 
 import pytest
 import requests
@@ -30,6 +33,108 @@ from azure.cosmos.http_constants import HttpHeaders, StatusCodes
 from azure.cosmos.partition_key import PartitionKey
 
 
+_KEY_PARTITION_KEY = PartitionKey(path='/key', kind='Hash')
+
+# header names read by the request interceptors on every intercepted request
+_PARTITION_KEY_HEADER = HttpHeaders.PartitionKey
+_PRIORITY_LEVEL_HEADER = HttpHeaders.PriorityLevel
+# ExecuteFunction(_Request, global_endpoint_manager, request_params, connection_policy, pipeline_client, request)
+_REQUEST_ARG_INDEX = 4
+
+_TRIGGER_T1_BODY = (
+    'function() {'
+    '    var item = getContext().getRequest().getBody();'
+    '    item.id = item.id.toUpperCase() + \'t1\';'
+    '    getContext().getRequest().setBody(item);'
+    '}')
+_TRIGGER_RESPONSE1_BODY = (
+    'function() {'
+    '    var prebody = getContext().getRequest().getBody();'
+    '    if (prebody.id != \'TESTING POST TRIGGERt1\')'
+    '        throw \'id mismatch\';'
+    '    var postbody = getContext().getResponse().getBody();'
+    '    if (postbody.id != \'TESTING POST TRIGGERt1\')'
+    '        throw \'id mismatch\';'
+    '}')
+# can't be used because setValue is currently disabled
+_TRIGGER_RESPONSE2_BODY = (
+    'function() {'
+    '    var predoc = getContext().getRequest().getBody();'
+    '    var postdoc = getContext().getResponse().getBody();'
+    '    getContext().getResponse().setValue('
+    '        \'predocname\', predoc.id + \'response2\');'
+    '    getContext().getResponse().setValue('
+    '        \'postdocname\', postdoc.id + \'response2\');'
+    '}')
+_TRIGGER_T3_BODY = (
+    'function() {'
+    '    var item = getContext().getRequest().getBody();'
+    '    item.id = item.id.toLowerCase() + \'t3\';'
+    '    getContext().getRequest().setBody(item);'
+    '}')
+
+_TRIGGERS_IN_COLLECTION1 = (
+    MappingProxyType({
+        'id': 't1',
+        'body': _TRIGGER_T1_BODY,
+        'triggerType': documents.TriggerType.Pre,
+        'triggerOperation': documents.TriggerOperation.All
+    }),
+    MappingProxyType({
+        'id': 'response1',
+        'body': _TRIGGER_RESPONSE1_BODY,
+        'triggerType': documents.TriggerType.Post,
+        'triggerOperation': documents.TriggerOperation.All
+    }),
+    MappingProxyType({
+        'id': 'response2',
+        'body': _TRIGGER_RESPONSE2_BODY,
+        'triggerType': documents.TriggerType.Post,
+        'triggerOperation': documents.TriggerOperation.All,
+    }))
+_TRIGGERS_IN_COLLECTION2 = (
+    MappingProxyType({
+        'id': "t2",
+        'body': "function() { }",  # trigger already stringified
+        'triggerType': documents.TriggerType.Pre,
+        'triggerOperation': documents.TriggerOperation.All
+    }),
+    MappingProxyType({
+        'id': "t3",
+        'body': _TRIGGER_T3_BODY,
+        'triggerType': documents.TriggerType.Pre,
+        'triggerOperation': documents.TriggerOperation.All
+    }))
+_TRIGGERS_IN_COLLECTION3 = (
+    MappingProxyType({
+        'id': 'triggerOpType',
+        'body': 'function() { }',
+        'triggerType': documents.TriggerType.Post,
+        'triggerOperation': documents.TriggerOperation.Delete,
+    }),)
+
+
+_SPROC_COUNTER_BODY = (
+    'function () {'
+    '  for (var i = 0; i < 1000; i++) {'
+    '    var item = getContext().getResponse().getBody();'
+    '    if (i > 0 && item != i - 1) throw \'body mismatch\';'
+    '    getContext().getResponse().setBody(i);'
+    '  }'
+    '}')
+_SPROC_APPEND_BODY = (
+    'function () {'
+    '  for (var i = 0; i < 10; i++) {'
+    '    getContext().getResponse().appendValue(\'Body\', i);'
+    '  }'
+    '}')
+_SPROC_ECHO_INPUT_BODY = (
+    'function (input) {'
+    '  getContext().getResponse().setBody('
+    '      \'a\' + input.temp);'
+    '}')
+
+
 class TimeoutTransport(RequestsTransport):
 
     def __init__(self, response):
@@ -49,6 +154,31 @@ class TimeoutTransport(RequestsTransport):
         return response
 
 
+def _count_feed(feed, cap):
+    """Counts the results of a feed, stopping once more than cap results were seen.
+    """
+    count = 0
+    for _ in feed:
+        count += 1
+        if count > cap:
+            break
+    return count
+
+
+def _prefetched(iterator):
+    """Yields from iterator while the next element is fetched on a background thread.
+    """
+    sentinel = object()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending = executor.submit(next, iterator, sentinel)
+        while True:
+            value = pending.result()
+            if value is sentinel:
+                return
+            pending = executor.submit(next, iterator, sentinel)
+            yield value
+
+
 @pytest.mark.cosmosEmulator
 class TestCRUDOperations(unittest.TestCase):
     """Python CRUD Tests.
@@ -84,6 +214,24 @@ class TestCRUDOperations(unittest.TestCase):
                 "tests.")
         cls.client = cosmos_client.CosmosClient(cls.host, cls.masterKey)
         cls.databaseForTest = cls.client.get_database_client(cls.configs.TEST_DATABASE_ID)
+        # Warm up the connection and routing information once so individual tests don't pay for it.
+        cls.client.get_database_account()
+        cls.shared_container = cls.databaseForTest.get_container_client(cls.configs.TEST_MULTI_PARTITION_CONTAINER_ID)
+        cls.containerForTestProperties = cls.shared_container.read()
+        # Item shared by the patch tests; test_conditional_patching only touches fields the other test ignores.
+        cls.patch_item = cls.shared_container.upsert_item({
+            "id": "patch_item",
+            "pk": "patch_item_pk",
+            "prop": "prop1",
+            "address": {
+                "city": "Redmond"
+            },
+            "company": "Microsoft",
+            "number": 3})
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.shared_container.delete_item(item=cls.patch_item['id'], partition_key=cls.patch_item['pk'])
 
     def test_database_crud(self):
         database_id = str(uuid.uuid4())
@@ -544,7 +692,7 @@ class TestCRUDOperations(unittest.TestCase):
     def test_partitioned_collection_execute_stored_procedure(self):
         created_db = self.databaseForTest
 
-        created_collection = self.databaseForTest.get_container_client(self.configs.TEST_MULTI_PARTITION_CONTAINER_ID)
+        created_collection = self.shared_container
         document_id = str(uuid.uuid4())
 
         sproc = {
@@ -575,9 +723,7 @@ class TestCRUDOperations(unittest.TestCase):
             3)
 
     def test_partitioned_collection_partition_key_value_types(self):
-        created_db = self.databaseForTest
-
-        created_collection = created_db.get_container_client(self.configs.TEST_MULTI_PARTITION_CONTAINER_ID)
+        created_collection = self.shared_container
 
         document_definition = {'id': 'document1' + str(uuid.uuid4()),
                                'pk': None,
@@ -634,7 +780,7 @@ class TestCRUDOperations(unittest.TestCase):
     def test_partitioned_collection_conflict_crud_and_query(self):
         created_db = self.databaseForTest
 
-        created_collection = self.databaseForTest.get_container_client(self.configs.TEST_MULTI_PARTITION_CONTAINER_ID)
+        created_collection = self.shared_container
 
         conflict_definition = {'id': 'new conflict',
                                'resourceId': 'doc1',
@@ -693,7 +839,7 @@ class TestCRUDOperations(unittest.TestCase):
         # create database
         created_db = self.databaseForTest
         # create collection
-        created_collection = self.databaseForTest.get_container_client(self.configs.TEST_MULTI_PARTITION_CONTAINER_ID)
+        created_collection = self.shared_container
         # read documents
         documents = list(created_collection.read_all_items())
         # create a document
@@ -852,7 +998,7 @@ class TestCRUDOperations(unittest.TestCase):
         created_db = self.databaseForTest
 
         # create collection
-        created_collection = self.databaseForTest.get_container_client(self.configs.TEST_MULTI_PARTITION_CONTAINER_ID)
+        created_collection = self.shared_container
 
         # read documents and check count
         documents = list(created_collection.read_all_items())
@@ -1362,7 +1508,7 @@ class TestCRUDOperations(unittest.TestCase):
         # create database
         db = self.databaseForTest
         # create collection
-        collection = self.databaseForTest.get_container_client(self.configs.TEST_MULTI_PARTITION_CONTAINER_ID)
+        collection = self.shared_container
         # read triggers
         triggers = list(collection.scripts.list_triggers())
         # create a trigger
@@ -1427,7 +1573,7 @@ class TestCRUDOperations(unittest.TestCase):
         # create database
         db = self.databaseForTest
         # create collection
-        collection = self.databaseForTest.get_container_client(self.configs.TEST_MULTI_PARTITION_CONTAINER_ID)
+        collection = self.shared_container
         # read udfs
         udfs = list(collection.scripts.list_user_defined_functions())
         # create a udf
@@ -1479,7 +1625,7 @@ class TestCRUDOperations(unittest.TestCase):
         # create database
         db = self.databaseForTest
         # create collection
-        collection = self.databaseForTest.get_container_client(self.configs.TEST_MULTI_PARTITION_CONTAINER_ID)
+        collection = self.shared_container
         # read sprocs
         sprocs = list(collection.scripts.list_stored_procedures())
         # create a sproc
@@ -1536,7 +1682,7 @@ class TestCRUDOperations(unittest.TestCase):
                                            replaced_sproc['id'])
 
     def test_script_logging_execute_stored_procedure(self):
-        created_collection = self.databaseForTest.get_container_client(self.configs.TEST_MULTI_PARTITION_CONTAINER_ID)
+        created_collection = self.shared_container
         stored_proc_id = 'storedProcedure-1-' + str(uuid.uuid4())
 
         sproc = {
@@ -1591,7 +1737,7 @@ class TestCRUDOperations(unittest.TestCase):
         # create database
         db = self.databaseForTest
         # create collection
-        collection = db.get_container_client(self.configs.TEST_MULTI_PARTITION_CONTAINER_ID)
+        collection = self.shared_container
 
         collection_properties = collection.read()
         self.assertEqual(collection_properties['indexingPolicy']['indexingMode'],
@@ -1638,7 +1784,7 @@ class TestCRUDOperations(unittest.TestCase):
         db = self.databaseForTest
 
         # no indexing policy specified
-        collection = db.get_container_client(self.configs.TEST_MULTI_PARTITION_CONTAINER_ID)
+        collection = self.shared_container
 
         collection_properties = collection.read()
         self._check_default_indexing_policy_paths(collection_properties['indexingPolicy'])
@@ -1942,262 +2088,178 @@ class TestCRUDOperations(unittest.TestCase):
         # Get query results page by page.
         results = resources['coll'].read_all_items(max_item_count=2)
 
-        page_iter = results.by_page()
+        page_iter = _prefetched(results.by_page())
         first_block = list(next(page_iter))
         self.assertEqual(2, len(first_block), 'First block should have 2 entries.')
         self.assertEqual(resources['doc1']['id'], first_block[0]['id'])
         self.assertEqual(resources['doc2']['id'], first_block[1]['id'])
-        self.assertEqual(1, len(list(next(page_iter))), 'Second block should have 1 entry.')
+        second_block = next(page_iter)
+        self.assertEqual(1, sum(1 for _ in second_block), 'Second block should have 1 entry.')
         with self.assertRaises(StopIteration):
             next(page_iter)
 
         self.databaseForTest.delete_container(collection.id)
 
     def test_trigger_functionality(self):
-        triggers_in_collection1 = [
-            {
-                'id': 't1',
-                'body': (
-                        'function() {' +
-                        '    var item = getContext().getRequest().getBody();' +
-                        '    item.id = item.id.toUpperCase() + \'t1\';' +
-                        '    getContext().getRequest().setBody(item);' +
-                        '}'),
-                'triggerType': documents.TriggerType.Pre,
-                'triggerOperation': documents.TriggerOperation.All
-            },
-            {
-                'id': 'response1',
-                'body': (
-                        'function() {' +
-                        '    var prebody = getContext().getRequest().getBody();' +
-                        '    if (prebody.id != \'TESTING POST TRIGGERt1\')'
-                        '        throw \'id mismatch\';' +
-                        '    var postbody = getContext().getResponse().getBody();' +
-                        '    if (postbody.id != \'TESTING POST TRIGGERt1\')'
-                        '        throw \'id mismatch\';'
-                        '}'),
-                'triggerType': documents.TriggerType.Post,
-                'triggerOperation': documents.TriggerOperation.All
-            },
-            {
-                'id': 'response2',
-                # can't be used because setValue is currently disabled
-                'body': (
-                        'function() {' +
-                        '    var predoc = getContext().getRequest().getBody();' +
-                        '    var postdoc = getContext().getResponse().getBody();' +
-                        '    getContext().getResponse().setValue(' +
-                        '        \'predocname\', predoc.id + \'response2\');' +
-                        '    getContext().getResponse().setValue(' +
-                        '        \'postdocname\', postdoc.id + \'response2\');' +
-                        '}'),
-                'triggerType': documents.TriggerType.Post,
-                'triggerOperation': documents.TriggerOperation.All,
-            }]
-        triggers_in_collection2 = [
-            {
-                'id': "t2",
-                'body': "function() { }",  # trigger already stringified
-                'triggerType': documents.TriggerType.Pre,
-                'triggerOperation': documents.TriggerOperation.All
-            },
-            {
-                'id': "t3",
-                'body': (
-                        'function() {' +
-                        '    var item = getContext().getRequest().getBody();' +
-                        '    item.id = item.id.toLowerCase() + \'t3\';' +
-                        '    getContext().getRequest().setBody(item);' +
-                        '}'),
-                'triggerType': documents.TriggerType.Pre,
-                'triggerOperation': documents.TriggerOperation.All
-            }]
-        triggers_in_collection3 = [
-            {
-                'id': 'triggerOpType',
-                'body': 'function() { }',
-                'triggerType': documents.TriggerType.Post,
-                'triggerOperation': documents.TriggerOperation.Delete,
-            }]
-
-        def __CreateTriggers(collection, triggers):
-            """Creates triggers.
+        def __CreateTriggers(executor, collection, triggers):
+            """Submits trigger creation for a collection.
 
             :Parameters:
-                - `client`: cosmos_client_connection.CosmosClientConnection
-                - `collection`: dict
+                - `executor`: concurrent.futures.Executor
+                - `collection`: ContainerProxy
+                - `triggers`: list
 
+            :Returns:
+                list of (trigger definition, future) pairs.
             """
-            for trigger_i in triggers:
-                trigger = collection.scripts.create_trigger(body=trigger_i)
-                for property in trigger_i:
-                    self.assertEqual(
-                        trigger[property],
-                        trigger_i[property],
-                        'property {property} should match'.format(property=property))
+            return [(trigger_i, executor.submit(collection.scripts.create_trigger, body=trigger_i))
+                    for trigger_i in triggers]
 
         # create database
         db = self.databaseForTest
+        unique_id = str(uuid.uuid4())
+        executor = ThreadPoolExecutor(max_workers=4)
+        self.addCleanup(executor.shutdown)
         # create collections
-        pkd = PartitionKey(path='/id', kind='Hash')
-        collection1 = db.create_container(id='test_trigger_functionality 1 ' + str(uuid.uuid4()),
-                                          partition_key=PartitionKey(path='/key', kind='Hash'))
-        collection2 = db.create_container(id='test_trigger_functionality 2 ' + str(uuid.uuid4()),
-                                          partition_key=PartitionKey(path='/key', kind='Hash'))
-        collection3 = db.create_container(id='test_trigger_functionality 3 ' + str(uuid.uuid4()),
-                                          partition_key=PartitionKey(path='/key', kind='Hash'))
+        collection_futures = [
+            executor.submit(db.create_container,
+                            id='test_trigger_functionality {} '.format(i) + unique_id,
+                            partition_key=_KEY_PARTITION_KEY)
+            for i in range(1, 4)]
+        collection1, collection2, collection3 = [future.result() for future in collection_futures]
         # create triggers
-        __CreateTriggers(collection1, triggers_in_collection1)
-        __CreateTriggers(collection2, triggers_in_collection2)
-        __CreateTriggers(collection3, triggers_in_collection3)
+        pending_triggers = (__CreateTriggers(executor, collection1, _TRIGGERS_IN_COLLECTION1) +
+                            __CreateTriggers(executor, collection2, _TRIGGERS_IN_COLLECTION2) +
+                            __CreateTriggers(executor, collection3, _TRIGGERS_IN_COLLECTION3))
+        for trigger_i, future in pending_triggers:
+            trigger = future.result()
+            for property in trigger_i:
+                self.assertEqual(
+                    trigger[property],
+                    trigger_i[property],
+                    'property {property} should match'.format(property=property))
         # create document
-        triggers_1 = list(collection1.scripts.list_triggers())
-        self.assertEqual(len(triggers_1), 3)
-        document_1_1 = collection1.create_item(
+        self.assertEqual(_count_feed(collection1.scripts.list_triggers(max_item_count=4), 4), 3)
+        future_1_1 = executor.submit(
+            collection1.create_item,
             body={'id': 'doc1',
                   'key': 'value'},
             pre_trigger_include='t1'
         )
-        self.assertEqual(document_1_1['id'],
-                         'DOC1t1',
-                         'id should be capitalized')
-
-        document_1_2 = collection1.create_item(
+        future_1_2 = executor.submit(
+            collection1.create_item,
             body={'id': 'testing post trigger', 'key': 'value'},
             pre_trigger_include='t1',
             post_trigger_include='response1',
         )
-        self.assertEqual(document_1_2['id'], 'TESTING POST TRIGGERt1')
-
-        document_1_3 = collection1.create_item(
+        future_1_3 = executor.submit(
+            collection1.create_item,
             body={'id': 'responseheaders', 'key': 'value'},
             pre_trigger_include='t1'
         )
-        self.assertEqual(document_1_3['id'], "RESPONSEHEADERSt1")
-
-        triggers_2 = list(collection2.scripts.list_triggers())
-        self.assertEqual(len(triggers_2), 2)
-        document_2_1 = collection2.create_item(
+        self.assertEqual(_count_feed(collection2.scripts.list_triggers(max_item_count=3), 3), 2)
+        future_2_1 = executor.submit(
+            collection2.create_item,
             body={'id': 'doc2',
                   'key': 'value2'},
             pre_trigger_include='t2'
         )
-        self.assertEqual(document_2_1['id'],
-                         'doc2',
-                         'id shouldn\'t change')
-        document_2_2 = collection2.create_item(
+        future_2_2 = executor.submit(
+            collection2.create_item,
             body={'id': 'Doc3',
                   'prop': 'empty',
                   'key': 'value2'},
             pre_trigger_include='t3')
-        self.assertEqual(document_2_2['id'], 'doc3t3')
 
-        triggers_3 = list(collection3.scripts.list_triggers())
-        self.assertEqual(len(triggers_3), 1)
-        with self.assertRaises(Exception):
+        self.assertEqual(future_1_1.result()['id'],
+                         'DOC1t1',
+                         'id should be capitalized')
+        self.assertEqual(future_1_2.result()['id'], 'TESTING POST TRIGGERt1')
+        self.assertEqual(future_1_3.result()['id'], "RESPONSEHEADERSt1")
+        self.assertEqual(future_2_1.result()['id'],
+                         'doc2',
+                         'id shouldn\'t change')
+        self.assertEqual(future_2_2.result()['id'], 'doc3t3')
+
+        self.assertEqual(_count_feed(collection3.scripts.list_triggers(max_item_count=2), 2), 1)
+        with self.assertRaises(exceptions.CosmosHttpResponseError) as e:
             collection3.create_item(
                 body={'id': 'Docoptype', 'key': 'value2'},
                 post_trigger_include='triggerOpType'
             )
+        self.assertEqual(e.exception.status_code, StatusCodes.BAD_REQUEST)
 
-        db.delete_container(collection1)
-        db.delete_container(collection2)
-        db.delete_container(collection3)
+        for future in [executor.submit(db.delete_container, collection)
+                       for collection in (collection1, collection2, collection3)]:
+            future.result()
 
     def test_stored_procedure_functionality(self):
         # create database
         db = self.databaseForTest
         # create collection
-        collection = self.databaseForTest.get_container_client(self.configs.TEST_MULTI_PARTITION_CONTAINER_ID)
+        collection = self.shared_container
 
-        stored_proc_id = 'storedProcedure-1-' + str(uuid.uuid4())
+        unique_id = str(uuid.uuid4())
+        stored_proc_id = 'storedProcedure-1-' + unique_id
 
         sproc1 = {
             'id': stored_proc_id,
-            'body': (
-                    'function () {' +
-                    '  for (var i = 0; i < 1000; i++) {' +
-                    '    var item = getContext().getResponse().getBody();' +
-                    '    if (i > 0 && item != i - 1) throw \'body mismatch\';' +
-                    '    getContext().getResponse().setBody(i);' +
-                    '  }' +
-                    '}')
+            'body': _SPROC_COUNTER_BODY
         }
 
-        retrieved_sproc = collection.scripts.create_stored_procedure(sproc1)
-        result = collection.scripts.execute_stored_procedure(
-            sproc=retrieved_sproc['id'],
-            partition_key=1
-        )
-        self.assertEqual(result, 999)
-        stored_proc_id_2 = 'storedProcedure-2-' + str(uuid.uuid4())
+        stored_proc_id_2 = 'storedProcedure-2-' + unique_id
         sproc2 = {
             'id': stored_proc_id_2,
-            'body': (
-                    'function () {' +
-                    '  for (var i = 0; i < 10; i++) {' +
-                    '    getContext().getResponse().appendValue(\'Body\', i);' +
-                    '  }' +
-                    '}')
+            'body': _SPROC_APPEND_BODY
         }
-        retrieved_sproc2 = collection.scripts.create_stored_procedure(sproc2)
-        result = collection.scripts.execute_stored_procedure(
-            sproc=retrieved_sproc2['id'],
-            partition_key=1
-        )
-        self.assertEqual(int(result), 123456789)
-        stored_proc_id_3 = 'storedProcedure-3-' + str(uuid.uuid4())
+        stored_proc_id_3 = 'storedProcedure-3-' + unique_id
         sproc3 = {
             'id': stored_proc_id_3,
-            'body': (
-                    'function (input) {' +
-                    '  getContext().getResponse().setBody(' +
-                    '      \'a\' + input.temp);' +
-                    '}')
+            'body': _SPROC_ECHO_INPUT_BODY
         }
-        retrieved_sproc3 = collection.scripts.create_stored_procedure(sproc3)
-        result = collection.scripts.execute_stored_procedure(
-            sproc=retrieved_sproc3['id'],
-            params={'temp': 'so'},
-            partition_key=1
-        )
-        self.assertEqual(result, 'aso')
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            retrieved_sprocs = list(executor.map(collection.scripts.create_stored_procedure, [sproc1, sproc2, sproc3]))
+            results = list(executor.map(
+                lambda args: collection.scripts.execute_stored_procedure(sproc=args[0], partition_key=1, **args[1]),
+                [(retrieved_sprocs[0]['id'], {}),
+                 (retrieved_sprocs[1]['id'], {}),
+                 (retrieved_sprocs[2]['id'], {'params': {'temp': 'so'}})]))
+        self.assertEqual(results[0], 999)
+        self.assertEqual(int(results[1]), 123456789)
+        self.assertEqual(results[2], 'aso')
 
     def __ValidateOfferResponseBody(self, offer, expected_coll_link, expected_offer_type):
         # type: (Offer, str, Any) -> None
-        self.assertIsNotNone(offer.properties['id'], 'Id cannot be null.')
-        self.assertIsNotNone(offer.properties.get('_rid'), 'Resource Id (Rid) cannot be null.')
-        self.assertIsNotNone(offer.properties.get('_self'), 'Self Link cannot be null.')
-        self.assertIsNotNone(offer.properties.get('resource'), 'Resource Link cannot be null.')
-        self.assertTrue(offer.properties['_self'].find(offer.properties['id']) != -1,
+        properties = offer.properties
+        offer_id = properties['id']
+        self_link = properties.get('_self')
+        resource_link = properties.get('resource')
+        self.assertIsNotNone(offer_id, 'Id cannot be null.')
+        self.assertIsNotNone(properties.get('_rid'), 'Resource Id (Rid) cannot be null.')
+        self.assertIsNotNone(self_link, 'Self Link cannot be null.')
+        self.assertIsNotNone(resource_link, 'Resource Link cannot be null.')
+        self.assertTrue(self_link.find(offer_id) != -1,
                         'Offer id not contained in offer self link.')
-        self.assertEqual(expected_coll_link.strip('/'), offer.properties['resource'].strip('/'))
+        self.assertEqual(expected_coll_link.strip('/'), resource_link.strip('/'))
         if (expected_offer_type):
-            self.assertEqual(expected_offer_type, offer.properties.get('offerType'))
+            self.assertEqual(expected_offer_type, properties.get('offerType'))
 
     def test_offer_read_and_query(self):
-        # Create database.
-        db = self.databaseForTest
-        collection = db.get_container_client(self.configs.TEST_MULTI_PARTITION_CONTAINER_ID)
+        collection = self.shared_container
         # Read the offer.
         expected_offer = collection.get_throughput()
-        collection_properties = collection.read()
-        self.__ValidateOfferResponseBody(expected_offer, collection_properties.get('_self'), None)
+        self.__ValidateOfferResponseBody(expected_offer, self.containerForTestProperties.get('_self'), None)
 
     def test_offer_replace(self):
-        # Create database.
-        db = self.databaseForTest
-        # Create collection.
-        collection = db.get_container_client(self.configs.TEST_MULTI_PARTITION_CONTAINER_ID)
+        collection = self.shared_container
         # Read Offer
         expected_offer = collection.get_throughput()
-        collection_properties = collection.read()
-        self.__ValidateOfferResponseBody(expected_offer, collection_properties.get('_self'), None)
+        collection_self_link = self.containerForTestProperties.get('_self')
+        self.__ValidateOfferResponseBody(expected_offer, collection_self_link, None)
         # Replace the offer.
         replaced_offer = collection.replace_throughput(expected_offer.offer_throughput + 100)
-        collection_properties = collection.read()
-        self.__ValidateOfferResponseBody(replaced_offer, collection_properties.get('_self'), None)
+        self.__ValidateOfferResponseBody(replaced_offer, collection_self_link, None)
         # Check if the replaced offer is what we expect.
         self.assertEqual(expected_offer.properties.get('content').get('offerThroughput') + 100,
                          replaced_offer.properties.get('content').get('offerThroughput'))
@@ -2225,7 +2287,7 @@ class TestCRUDOperations(unittest.TestCase):
 
     def test_index_progress_headers(self):
         created_db = self.databaseForTest
-        created_container = created_db.get_container_client(self.configs.TEST_MULTI_PARTITION_CONTAINER_ID)
+        created_container = self.shared_container
         created_container.read(populate_quota_info=True)
         self.assertFalse(HttpHeaders.LazyIndexingProgress in created_db.client_connection.last_response_headers)
         self.assertTrue(HttpHeaders.IndexTransformationProgress in created_db.client_connection.last_response_headers)
@@ -2246,40 +2308,23 @@ class TestCRUDOperations(unittest.TestCase):
         created_db.delete_container(none_coll)
 
     def test_id_validation(self):
-        # Id shouldn't end with space.
-        try:
-            self.client.create_database(id='id_with_space ')
-            self.assertFalse(True)
-        except ValueError as e:
-            self.assertEqual('Id ends with a space or newline.', e.args[0])
-        # Id shouldn't contain '/'.
-
-        try:
-            self.client.create_database(id='id_with_illegal/_char')
-            self.assertFalse(True)
-        except ValueError as e:
-            self.assertEqual('Id contains illegal chars.', e.args[0])
-        # Id shouldn't contain '\\'.
-
-        try:
-            self.client.create_database(id='id_with_illegal\\_char')
-            self.assertFalse(True)
-        except ValueError as e:
-            self.assertEqual('Id contains illegal chars.', e.args[0])
-        # Id shouldn't contain '?'.
-
-        try:
-            self.client.create_database(id='id_with_illegal?_char')
-            self.assertFalse(True)
-        except ValueError as e:
-            self.assertEqual('Id contains illegal chars.', e.args[0])
-        # Id shouldn't contain '#'.
-
-        try:
-            self.client.create_database(id='id_with_illegal#_char')
-            self.assertFalse(True)
-        except ValueError as e:
-            self.assertEqual('Id contains illegal chars.', e.args[0])
+        invalid_ids = [
+            # Id shouldn't end with space.
+            ('id_with_space ', 'Id ends with a space or newline.'),
+            # Id shouldn't contain '/'.
+            ('id_with_illegal/_char', 'Id contains illegal chars.'),
+            # Id shouldn't contain '\\'.
+            ('id_with_illegal\\_char', 'Id contains illegal chars.'),
+            # Id shouldn't contain '?'.
+            ('id_with_illegal?_char', 'Id contains illegal chars.'),
+            # Id shouldn't contain '#'.
+            ('id_with_illegal#_char', 'Id contains illegal chars.')
+        ]
+        for invalid_id, expected_message in invalid_ids:
+            with self.subTest(id=invalid_id):
+                with self.assertRaises(ValueError) as e:
+                    self.client.create_database(id=invalid_id)
+                self.assertEqual(expected_message, e.exception.args[0])
 
         # Id can begin with space
         db = self.client.create_database(id=' id_begin_space' + str(uuid.uuid4()))
@@ -2289,6 +2334,7 @@ class TestCRUDOperations(unittest.TestCase):
 
     def test_get_resource_with_dictionary_and_object(self):
         created_db = self.databaseForTest
+        unique_id = str(uuid.uuid4())
 
         # read database with id
         read_db = self.client.get_database_client(created_db.id)
@@ -2302,7 +2348,7 @@ class TestCRUDOperations(unittest.TestCase):
         read_db = self.client.get_database_client(created_db.read())
         self.assertEqual(read_db.id, created_db.id)
 
-        created_container = self.databaseForTest.get_container_client(self.configs.TEST_MULTI_PARTITION_CONTAINER_ID)
+        created_container = self.shared_container
 
         # read container with id
         read_container = created_db.get_container_client(created_container.id)
@@ -2317,7 +2363,7 @@ class TestCRUDOperations(unittest.TestCase):
         read_container = created_db.get_container_client(created_properties)
         self.assertEqual(read_container.id, created_container.id)
 
-        created_item = created_container.create_item({'id': '1' + str(uuid.uuid4()), 'pk': 'pk'})
+        created_item = created_container.create_item({'id': '1' + unique_id, 'pk': 'pk'})
 
         # read item with id
         read_item = created_container.read_item(item=created_item['id'], partition_key=created_item['pk'])
@@ -2328,7 +2374,7 @@ class TestCRUDOperations(unittest.TestCase):
         self.assertEqual(read_item['id'], created_item['id'])
 
         created_sproc = created_container.scripts.create_stored_procedure({
-            'id': 'storedProcedure' + str(uuid.uuid4()),
+            'id': 'storedProcedure' + unique_id,
             'body': 'function () { }'
         })
 
@@ -2341,7 +2387,7 @@ class TestCRUDOperations(unittest.TestCase):
         self.assertEqual(read_sproc['id'], created_sproc['id'])
 
         created_trigger = created_container.scripts.create_trigger({
-            'id': 'sample trigger' + str(uuid.uuid4()),
+            'id': 'sample trigger' + unique_id,
             'serverScript': 'function() {var x = 10;}',
             'triggerType': documents.TriggerType.Pre,
             'triggerOperation': documents.TriggerOperation.All
@@ -2356,7 +2402,7 @@ class TestCRUDOperations(unittest.TestCase):
         self.assertEqual(read_trigger['id'], created_trigger['id'])
 
         created_udf = created_container.scripts.create_user_defined_function({
-            'id': 'sample udf' + str(uuid.uuid4()),
+            'id': 'sample udf' + unique_id,
             'body': 'function() {var x = 10;}'
         })
 
@@ -2369,7 +2415,7 @@ class TestCRUDOperations(unittest.TestCase):
         self.assertEqual(created_udf['id'], read_udf['id'])
 
         created_user = created_db.create_user({
-            'id': 'user' + str(uuid.uuid4())
+            'id': 'user' + unique_id
         })
 
         # read user with id
@@ -2386,7 +2432,7 @@ class TestCRUDOperations(unittest.TestCase):
         self.assertEqual(read_user.id, created_user.id)
 
         created_permission = created_user.create_permission({
-            'id': 'all permission' + str(uuid.uuid4()),
+            'id': 'all permission' + unique_id,
             'permissionMode': documents.PermissionMode.All,
             'resource': created_container.container_link,
             'resourcePartitionKey': [1]
@@ -2450,19 +2496,8 @@ class TestCRUDOperations(unittest.TestCase):
     #     created_db.delete_container(created_collection)
 
     def test_patch_operations(self):
-        created_container = self.databaseForTest.get_container_client(self.configs.TEST_MULTI_PARTITION_CONTAINER_ID)
+        created_container = self.shared_container
 
-        # Create item to patch
-        item = {
-            "id": "patch_item",
-            "pk": "patch_item_pk",
-            "prop": "prop1",
-            "address": {
-                "city": "Redmond"
-            },
-            "company": "Microsoft",
-            "number": 3}
-        created_container.create_item(item)
         # Define and run patch operations
         operations = [
             {"op": "add", "path": "/color", "value": "yellow"},
@@ -2482,193 +2517,96 @@ class TestCRUDOperations(unittest.TestCase):
         self.assertEqual(patched_item.get("number"), 10)
         self.assertEqual(patched_item.get("favorite_color"), "yellow")
 
-        # Negative test - attempt to replace non-existent field
-        operations = [{"op": "replace", "path": "/wrong_field", "value": "wrong_value"}]
-        try:
-            created_container.patch_item(item="patch_item", partition_key="patch_item_pk", patch_operations=operations)
-        except exceptions.CosmosHttpResponseError as e:
-            self.assertEqual(e.status_code, StatusCodes.BAD_REQUEST)
-
-        # Negative test - attempt to remove non-existent field
-        operations = [{"op": "remove", "path": "/wrong_field"}]
-        try:
-            created_container.patch_item(item="patch_item", partition_key="patch_item_pk", patch_operations=operations)
-        except exceptions.CosmosHttpResponseError as e:
-            self.assertEqual(e.status_code, StatusCodes.BAD_REQUEST)
-
-        # Negative test - attempt to increment non-number field
-        operations = [{"op": "incr", "path": "/company", "value": 3}]
-        try:
-            created_container.patch_item(item="patch_item", partition_key="patch_item_pk", patch_operations=operations)
-        except exceptions.CosmosHttpResponseError as e:
-            self.assertEqual(e.status_code, StatusCodes.BAD_REQUEST)
-
-        # Negative test - attempt to move from non-existent field
-        operations = [{"op": "move", "from": "/wrong_field", "path": "/other_field"}]
-        try:
-            created_container.patch_item(item="patch_item", partition_key="patch_item_pk", patch_operations=operations)
-        except exceptions.CosmosHttpResponseError as e:
-            self.assertEqual(e.status_code, StatusCodes.BAD_REQUEST)
+        # Negative tests, submitted concurrently since they are independent
+        negative_cases = [
+            # attempt to replace non-existent field
+            ([{"op": "replace", "path": "/wrong_field", "value": "wrong_value"}], StatusCodes.BAD_REQUEST),
+            # attempt to remove non-existent field
+            ([{"op": "remove", "path": "/wrong_field"}], StatusCodes.BAD_REQUEST),
+            # attempt to increment non-number field
+            ([{"op": "incr", "path": "/company", "value": 3}], StatusCodes.BAD_REQUEST),
+            # attempt to move from non-existent field
+            ([{"op": "move", "from": "/wrong_field", "path": "/other_field"}], StatusCodes.BAD_REQUEST)
+        ]
+        with ThreadPoolExecutor(max_workers=len(negative_cases)) as executor:
+            futures = [(executor.submit(created_container.patch_item, item="patch_item", partition_key="patch_item_pk",
+                                        patch_operations=operations), expected_status)
+                       for operations, expected_status in negative_cases]
+            for future, expected_status in futures:
+                with self.assertRaises(exceptions.CosmosHttpResponseError) as e:
+                    future.result()
+                self.assertEqual(e.exception.status_code, expected_status)
 
     def test_conditional_patching(self):
-        created_container = self.databaseForTest.get_container_client(self.configs.TEST_MULTI_PARTITION_CONTAINER_ID)
-        # Create item to patch
-        item = {
-            "id": "conditional_patch_item",
-            "pk": "patch_item_pk",
-            "prop": "prop1",
-            "address": {
-                "city": "Redmond"
-            },
-            "company": "Microsoft",
-            "number": 3}
-        created_container.create_item(item)
+        created_container = self.shared_container
+        item = self.patch_item
 
-        # Define patch operations
-        operations = [
-            {"op": "add", "path": "/color", "value": "yellow"},
-            {"op": "remove", "path": "/prop"},
-            {"op": "replace", "path": "/company", "value": "CosmosDB"},
-            {"op": "set", "path": "/address/new_city", "value": "Atlanta"},
-            {"op": "incr", "path": "/number", "value": 7},
-            {"op": "move", "from": "/color", "path": "/favorite_color"}
-        ]
+        # Define patch operations, limited to a field test_patch_operations doesn't rely on
+        operations = [{"op": "set", "path": "/conditional_color", "value": "yellow"}]
 
         # Run patch operations with wrong filter
-        num_false = item.get("number") + 1
-        filter_predicate = "from root where root.number = " + str(num_false)
-        try:
-            created_container.patch_item(item="conditional_patch_item", partition_key="patch_item_pk",
+        filter_predicate = "from root where root.address.city = 'Not" + item["address"]["city"] + "'"
+        with self.assertRaises(exceptions.CosmosHttpResponseError) as e:
+            created_container.patch_item(item=item["id"], partition_key=item["pk"],
                                          patch_operations=operations, filter_predicate=filter_predicate)
-        except exceptions.CosmosHttpResponseError as e:
-            self.assertEqual(e.status_code, StatusCodes.PRECONDITION_FAILED)
+        self.assertEqual(e.exception.status_code, StatusCodes.PRECONDITION_FAILED)
 
         # Run patch operations with correct filter
-        filter_predicate = "from root where root.number = " + str(item.get("number"))
-        patched_item = created_container.patch_item(item="conditional_patch_item", partition_key="patch_item_pk",
+        filter_predicate = "from root where root.address.city = '" + item["address"]["city"] + "'"
+        patched_item = created_container.patch_item(item=item["id"], partition_key=item["pk"],
                                                     patch_operations=operations, filter_predicate=filter_predicate)
-        # Verify results from patch operations
-        self.assertTrue(patched_item.get("color") is None)
-        self.assertTrue(patched_item.get("prop") is None)
-        self.assertEqual(patched_item.get("company"), "CosmosDB")
-        self.assertEqual(patched_item.get("address").get("new_city"), "Atlanta")
-        self.assertEqual(patched_item.get("number"), 10)
-        self.assertEqual(patched_item.get("favorite_color"), "yellow")
-
-    # Temporarily commenting analytical storage tests until emulator support comes.
-    # def test_create_container_with_analytical_store_off(self):
-    #     # don't run test, for the time being, if running against the emulator
-    #     if 'localhost' in self.host or '127.0.0.1' in self.host:
-    #         return
-
-    #     created_db = self.databaseForTest
-    #     collection_id = 'test_create_container_with_analytical_store_off_' + str(uuid.uuid4())
-    #     collection_indexing_policy = {'indexingMode': 'consistent'}
-    #     created_recorder = RecordDiagnostics()
-    #     created_collection = created_db.create_container(id=collection_id,
-    #                                                      indexing_policy=collection_indexing_policy,
-    #                                                      partition_key=PartitionKey(path="/pk", kind="Hash"), 
-    #                                                      response_hook=created_recorder)
-    #     properties = created_collection.read()
-    #     ttl_key = "analyticalStorageTtl"
-    #     self.assertTrue(ttl_key not in properties or properties[ttl_key] == None)
-
-    # def test_create_container_with_analytical_store_on(self):
-    #     # don't run test, for the time being, if running against the emulator
-    #     if 'localhost' in self.host or '127.0.0.1' in self.host:
-    #         return
-
-    #     created_db = self.databaseForTest
-    #     collection_id = 'test_create_container_with_analytical_store_on_' + str(uuid.uuid4())
-    #     collection_indexing_policy = {'indexingMode': 'consistent'}
-    #     created_recorder = RecordDiagnostics()
-    #     created_collection = created_db.create_container(id=collection_id,
-    #                                                      analytical_storage_ttl=-1,
-    #                                                      indexing_policy=collection_indexing_policy,
-    #                                                      partition_key=PartitionKey(path="/pk", kind="Hash"), 
-    #                                                      response_hook=created_recorder)
-    #     properties = created_collection.read()
-    #     ttl_key = "analyticalStorageTtl"
-    #     self.assertTrue(ttl_key in properties and properties[ttl_key] == -1)
-
-    # def test_create_container_if_not_exists_with_analytical_store_on(self):
-    #     # don't run test, for the time being, if running against the emulator
-    #     if 'localhost' in self.host or '127.0.0.1' in self.host:
-    #         return
-
-    #     # first, try when we know the container doesn't exist.
-    #     created_db = self.databaseForTest
-    #     collection_id = 'test_create_container_if_not_exists_with_analytical_store_on_' + str(uuid.uuid4())
-    #     collection_indexing_policy = {'indexingMode': 'consistent'}
-    #     created_recorder = RecordDiagnostics()
-    #     created_collection = created_db.create_container_if_not_exists(id=collection_id,
-    #                                                                    analytical_storage_ttl=-1,
-    #                                                                    indexing_policy=collection_indexing_policy,
-    #                                                                    partition_key=PartitionKey(path="/pk", kind="Hash"),
-    #                                                                    response_hook=created_recorder)
-    #     properties = created_collection.read()
-    #     ttl_key = "analyticalStorageTtl"
-    #     self.assertTrue(ttl_key in properties and properties[ttl_key] == -1)
-
-    #     # next, try when we know the container DOES exist. This way both code paths are tested.
-    #     created_collection = created_db.create_container_if_not_exists(id=collection_id,
-    #                                                                    analytical_storage_ttl=-1,
-    #                                                                    indexing_policy=collection_indexing_policy,
-    #                                                                    partition_key=PartitionKey(path="/pk", kind="Hash"),
-    #                                                                    response_hook=created_recorder)
-    #     properties = created_collection.read()
-    #     ttl_key = "analyticalStorageTtl"
-    #     self.assertTrue(ttl_key in properties and properties[ttl_key] == -1)
+        # Verify results from patch operations; the response already carries the new etag, so no read is needed
+        self.assertEqual(patched_item.get("conditional_color"), "yellow")
+        self.assertEqual(patched_item.get("address").get("city"), item["address"]["city"])
+        self.assertEqual(created_container.client_connection.last_response_headers[HttpHeaders.ETag],
+                         patched_item["_etag"])
+        self.assertNotEqual(item["_etag"], patched_item["_etag"])
 
     def test_priority_level(self):
         # These test verify if headers for priority level are sent
         # Feature must be enabled at the account level
         # If feature is not enabled the test will still pass as we just verify the headers were sent
-        created_container = self.databaseForTest.get_container_client(self.configs.TEST_MULTI_PARTITION_CONTAINER_ID)
-
         item1 = {"id": "item1", "pk": "pk1"}
         item2 = {"id": "item2", "pk": "pk2"}
-        self.OriginalExecuteFunction = _retry_utility.ExecuteFunction
-        priority_headers = []
-
-        # mock execute function to check if priority level set in headers
-
-        def priority_mock_execute_function(function, *args, **kwargs):
-            if args:
-                priority_headers.append(args[4].headers[HttpHeaders.PriorityLevel]
-                                              if HttpHeaders.PriorityLevel in args[4].headers else '')
-            return self.OriginalExecuteFunction(function, *args, **kwargs)
-
-        _retry_utility.ExecuteFunction = priority_mock_execute_function
-        # upsert item with high priority
-        created_container.upsert_item(body=item1, priority="High")
-        # check if the priority level was passed
-        self.assertEqual(priority_headers[-1], "High")
-        # upsert item with low priority
-        created_container.upsert_item(body=item2, priority="Low")
-        # check that headers passed low priority
-        self.assertEqual(priority_headers[-1], "Low")
-        # Repeat for read operations
-        item1_read = created_container.read_item("item1", "pk1", priority="High")
-        self.assertEqual(priority_headers[-1], "High")
-        item2_read = created_container.read_item("item2", "pk2", priority="Low")
-        self.assertEqual(priority_headers[-1], "Low")
-        # repeat for query
-        query = list(created_container.query_items("Select * from c", partition_key="pk1", priority="High"))
-
-        self.assertEqual(priority_headers[-1], "High")
-
-        # Negative Test: Verify that if we send a value other than High or Low that it will not set the header value
-        # and result in bad request
-        try:
-            item2_read = created_container.read_item("item2", "pk2", priority="Medium")
-        except exceptions.CosmosHttpResponseError as e:
-            self.assertEqual(e.status_code, StatusCodes.BAD_REQUEST)
-        _retry_utility.ExecuteFunction = self.OriginalExecuteFunction
+        # only the priority header of the most recent request is kept
+        priority_headers = deque(maxlen=1)
+
+        # the pipeline's custom hook policy records the priority level header of every request sent
+        def capture_priority_header(pipeline_request):
+            priority_headers.append(pipeline_request.http_request.headers.get(_PRIORITY_LEVEL_HEADER, ''))
+
+        with cosmos_client.CosmosClient(self.host, self.masterKey, raw_request_hook=capture_priority_header) as client:
+            created_container = client.get_database_client(self.databaseForTest.id).get_container_client(
+                self.shared_container.id)
+
+            # upsert item with high priority
+            created_container.upsert_item(body=item1, priority="High")
+            # check if the priority level was passed
+            self.assertEqual(priority_headers[-1], "High")
+            # upsert item with low priority
+            created_container.upsert_item(body=item2, priority="Low")
+            # check that headers passed low priority
+            self.assertEqual(priority_headers[-1], "Low")
+            # Repeat for read operations
+            item1_read = created_container.read_item("item1", "pk1", priority="High")
+            self.assertEqual(priority_headers[-1], "High")
+            item2_read = created_container.read_item("item2", "pk2", priority="Low")
+            self.assertEqual(priority_headers[-1], "Low")
+            # repeat for query
+            query = list(created_container.query_items("Select * from c", partition_key="pk1", priority="High"))
+
+            self.assertEqual(priority_headers[-1], "High")
+
+            # Negative Test: Verify that if we send a value other than High or Low that it will not set the header
+            # value and result in bad request
+            try:
+                item2_read = created_container.read_item("item2", "pk2", priority="Medium")
+            except exceptions.CosmosHttpResponseError as e:
+                self.assertEqual(e.status_code, StatusCodes.BAD_REQUEST)
 
     def _MockExecuteFunction(self, function, *args, **kwargs):
-        self.last_headers.append(args[4].headers[HttpHeaders.PartitionKey]
-                                 if HttpHeaders.PartitionKey in args[4].headers else '')
+        request = args[_REQUEST_ARG_INDEX]
+        self.last_headers.append(request.headers.get(_PARTITION_KEY_HEADER, ''))
         return self.OriginalExecuteFunction(function, *args, **kwargs)
 
 
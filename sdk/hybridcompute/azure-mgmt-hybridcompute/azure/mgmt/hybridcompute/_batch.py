@@ -0,0 +1,167 @@
+# ------------------------------------
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+# ------------------------------------
+"""Helpers packing several ARM GET requests into a single call to the ARM ``/batch`` endpoint."""
+import json
+from http.client import responses as _REASONS
+from typing import Any, Dict, List, Sequence, Tuple, Union
+
+from azure.core.exceptions import HttpResponseError
+from azure.core.rest import AsyncHttpResponse, HttpRequest, HttpResponse
+from azure.core.rest._http_response_impl import HttpResponseImpl
+from azure.core.rest._http_response_impl_async import AsyncHttpResponseImpl
+from azure.core.utils import case_insensitive_dict
+
+BATCH_API_VERSION = "2020-06-01"
+MAX_BATCH_SIZE = 20
+
+# Batch entries carry no request headers. Accept is the only one a request may have, since results come back as JSON.
+_BATCHABLE_HEADERS = frozenset(("accept",))
+
+
+def is_batchable(request: HttpRequest) -> bool:
+    """Whether a request can be sent through ``/batch`` without changing its meaning.
+
+    :param request: The request.
+    :type request: ~azure.core.rest.HttpRequest
+    :return: True for a GET carrying no header other than Accept.
+    :rtype: bool
+    """
+    return request.method.upper() == "GET" and all(name.lower() in _BATCHABLE_HEADERS for name in request.headers)
+
+
+def chunk_requests(requests: Sequence[HttpRequest], max_batch: int) -> List[Sequence[HttpRequest]]:
+    """Split requests into chunks the batch endpoint accepts.
+
+    :param requests: The requests to send.
+    :type requests: Sequence[~azure.core.rest.HttpRequest]
+    :param int max_batch: The maximum number of requests per batch.
+    :return: The chunks, in order.
+    :rtype: list[Sequence[~azure.core.rest.HttpRequest]]
+    :raises ValueError: If max_batch is out of range, a request isn't a GET or a request has headers other than Accept.
+    """
+    if not 0 < max_batch <= MAX_BATCH_SIZE:
+        raise ValueError("max_batch must be between 1 and {}.".format(MAX_BATCH_SIZE))
+    for request in requests:
+        if request.method.upper() != "GET":
+            raise ValueError("Only GET requests can be batched, got '{}'.".format(request.method))
+        if not is_batchable(request):
+            raise ValueError(
+                "Batched requests can't carry headers other than Accept, got {}.".format(sorted(request.headers))
+            )
+    return [requests[i : i + max_batch] for i in range(0, len(requests), max_batch)]
+
+
+def build_batch_request(format_url: Any, requests: Sequence[HttpRequest]) -> HttpRequest:
+    """Build the ``/batch`` request for one chunk.
+
+    :param format_url: The pipeline client's ``format_url``, used to make each url absolute.
+    :type format_url: callable
+    :param requests: The GET requests to pack.
+    :type requests: Sequence[~azure.core.rest.HttpRequest]
+    :return: The batch request.
+    :rtype: ~azure.core.rest.HttpRequest
+    """
+    body = {
+        "requests": [
+            {"name": str(index), "httpMethod": request.method.upper(), "url": format_url(request.url)}
+            for index, request in enumerate(requests)
+        ]
+    }
+    return HttpRequest(
+        "POST", format_url("/batch"), params={"api-version": BATCH_API_VERSION}, json=body
+    )
+
+
+def _split_batch_response(
+    response: Union[HttpResponse, AsyncHttpResponse], count: int
+) -> List[Tuple[int, Dict[str, str], bytes]]:
+    if response.status_code != 200:
+        # The batch call itself failed, so each request gets that failure as its own response.
+        return [(response.status_code, dict(response.headers), response.content)] * count
+    items = {item["name"]: item for item in response.json().get("responses", [])}
+    results = []
+    for index in range(count):
+        try:
+            item = items[str(index)]
+        except KeyError:
+            raise HttpResponseError(
+                message="Batch response is missing the result for request {}.".format(index), response=response
+            ) from None
+        content = item.get("content")
+        headers = case_insensitive_dict(item.get("headers") or {})
+        if content is not None:
+            headers.setdefault("Content-Type", "application/json")
+        body = json.dumps(content).encode("utf-8") if content is not None else b""
+        results.append((item["httpStatusCode"], dict(headers), body))
+    return results
+
+
+class _BatchedHttpResponse(HttpResponseImpl):
+    """A response unpacked from a batch, with its content already loaded."""
+
+
+class _AsyncBatchedHttpResponse(AsyncHttpResponseImpl):
+    """An async response unpacked from a batch, with its content already loaded."""
+
+
+def _build_item_response(
+    response_type: type,
+    request: HttpRequest,
+    envelope: Union[HttpResponse, AsyncHttpResponse],
+    result: Tuple[int, Dict[str, str], bytes],
+) -> Any:
+    status_code, headers, body = result
+    headers = case_insensitive_dict(headers)
+    response = response_type(
+        request=request,
+        internal_response=envelope,
+        status_code=status_code,
+        reason=_REASONS.get(status_code, ""),
+        content_type=headers.get("Content-Type"),
+        headers=headers,
+        stream_download_generator=None,
+    )
+    response._content = body  # pylint: disable=protected-access
+    return response
+
+
+def unpack_batch_response(envelope: HttpResponse, requests: Sequence[HttpRequest]) -> List[HttpResponse]:
+    """Split a ``/batch`` response into one response per packed request.
+
+    :param envelope: The response of the batch call.
+    :type envelope: ~azure.core.rest.HttpResponse
+    :param requests: The requests packed in the batch, in order.
+    :type requests: Sequence[~azure.core.rest.HttpRequest]
+    :return: One response per request, in the same order. If the batch call itself failed, each response
+        carries that failure.
+    :rtype: list[~azure.core.rest.HttpResponse]
+    :raises ~azure.core.exceptions.HttpResponseError: If the batch response is missing a request's result.
+    """
+    results = _split_batch_response(envelope, len(requests))
+    return [
+        _build_item_response(_BatchedHttpResponse, request, envelope, result)
+        for request, result in zip(requests, results)
+    ]
+
+
+def unpack_async_batch_response(
+    envelope: AsyncHttpResponse, requests: Sequence[HttpRequest]
+) -> List[AsyncHttpResponse]:
+    """Split an async ``/batch`` response into one response per packed request.
+
+    :param envelope: The response of the batch call, already read.
+    :type envelope: ~azure.core.rest.AsyncHttpResponse
+    :param requests: The requests packed in the batch, in order.
+    :type requests: Sequence[~azure.core.rest.HttpRequest]
+    :return: One response per request, in the same order. If the batch call itself failed, each response
+        carries that failure.
+    :rtype: list[~azure.core.rest.AsyncHttpResponse]
+    :raises ~azure.core.exceptions.HttpResponseError: If the batch response is missing a request's result.
+    """
+    results = _split_batch_response(envelope, len(requests))
+    return [
+        _build_item_response(_AsyncBatchedHttpResponse, request, envelope, result)
+        for request, result in zip(requests, results)
+    ]
@@ -0,0 +1,98 @@
+# ------------------------------------
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+# ------------------------------------
+"""Coalesces bursts of GET requests into ARM ``/batch`` calls."""
+import threading
+from concurrent.futures import Future
+from typing import Callable, List, Optional, Tuple
+
+from azure.core.rest import HttpRequest, HttpResponse
+
+# Below this many requests in flight a GET is sent right away: a lone request gains nothing from waiting.
+IN_FLIGHT_WATERMARK = 2
+
+
+class RequestDebouncer:
+    """Collects GET requests issued within a short window and sends them as one batch.
+
+    :param send_batch: Sends a list of GET requests and returns one response per request, in order.
+    :type send_batch: callable
+    :param float delay_ms: How long the first pending request waits for others to join its batch.
+    :param int max_batch: Pending requests are flushed as soon as this many are queued.
+    :param int watermark: Requests are only debounced once at least this many are in flight.
+    """
+
+    def __init__(
+        self,
+        send_batch: Callable[[List[HttpRequest]], List[HttpResponse]],
+        delay_ms: float,
+        max_batch: int,
+        watermark: int = IN_FLIGHT_WATERMARK,
+    ) -> None:
+        self._send_batch = send_batch
+        self._delay = delay_ms / 1000.0
+        self._max_batch = max_batch
+        self._watermark = watermark
+        self._lock = threading.Lock()
+        self._pending: List[Tuple[HttpRequest, "Future[HttpResponse]"]] = []
+        self._timer: Optional[threading.Timer] = None
+        self._in_flight = 0
+
+    def send(self, request: HttpRequest, send_now: Callable[[], HttpResponse]) -> HttpResponse:
+        """Send a GET request, batching it with concurrent ones when enough are in flight.
+
+        :param request: The GET request.
+        :type request: ~azure.core.rest.HttpRequest
+        :param send_now: Sends the request on its own; used when debouncing is bypassed.
+        :type send_now: callable
+        :return: The response to the request.
+        :rtype: ~azure.core.rest.HttpResponse
+        """
+        future: "Optional[Future[HttpResponse]]" = None
+        batch: List[Tuple[HttpRequest, "Future[HttpResponse]"]] = []
+        with self._lock:
+            self._in_flight += 1
+            if self._in_flight >= self._watermark:
+                future = Future()
+                self._pending.append((request, future))
+                if len(self._pending) >= self._max_batch:
+                    batch = self._take_pending()
+                elif self._timer is None:
+                    self._timer = threading.Timer(self._delay, self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+        try:
+            if future is None:
+                return send_now()
+            if batch:
+                self._send(batch)
+            return future.result()
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def flush(self) -> None:
+        """Send all pending requests now."""
+        with self._lock:
+            batch = self._take_pending()
+        if batch:
+            self._send(batch)
+
+    def _take_pending(self) -> List[Tuple[HttpRequest, "Future[HttpResponse]"]]:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        return batch
+
+    def _send(self, batch: List[Tuple[HttpRequest, "Future[HttpResponse]"]]) -> None:
+        try:
+            responses = self._send_batch([request for request, _ in batch])
+        except BaseException as ex:  # pylint: disable=broad-except
+            for _, future in batch:
+                future.set_exception(ex)
+            return
+        for (_, future), response in zip(batch, responses):
+            future.set_result(response)
+
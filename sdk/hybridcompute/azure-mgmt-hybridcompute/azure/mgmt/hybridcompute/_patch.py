@@ -6,9 +6,227 @@
 
 Follow our quickstart for examples: https://aka.ms/azsdk/python/dpcodegen/python/customize
 """
-from typing import List
+from copy import copy
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 
-__all__: List[str] = []  # Add all objects you want publicly available to users at this package level
+from azure.core.pipeline import policies
+from azure.core.rest import HttpRequest, HttpResponse
+from azure.core.utils import case_insensitive_dict
+from azure.mgmt.core import ARMPipelineClient
+from azure.mgmt.core.policies import ARMAutoResourceProviderRegistrationPolicy
+
+from . import models as _models
+from ._batch import MAX_BATCH_SIZE, build_batch_request, chunk_requests, is_batchable, unpack_batch_response
+from ._configuration import HybridComputeManagementClientConfiguration
+from ._debounce import RequestDebouncer
+from ._priority import PriorityQueuePolicy
+from ._hybrid_compute_management_client import (
+    HybridComputeManagementClient as HybridComputeManagementClientGenerated,
+)
+from ._serialization import Deserializer, Serializer
+from .operations import (
+    ExtensionMetadataOperations,
+    GatewaysOperations,
+    LicensesOperations,
+    MachineExtensionsOperations,
+    MachineRunCommandsOperations,
+    MachinesOperations,
+    NetworkProfileOperations,
+    NetworkSecurityPerimeterConfigurationsOperations,
+    Operations,
+    PrivateEndpointConnectionsOperations,
+    PrivateLinkResourcesOperations,
+    PrivateLinkScopesOperations,
+    SettingsOperations,
+)
+
+if TYPE_CHECKING:
+    # pylint: disable=unused-import,ungrouped-imports
+    from azure.core.credentials import TokenCredential
+
+# The models module doesn't change after import, so the registry handed to the serializers is built once.
+_CLIENT_MODELS: Dict[str, type] = {k: v for k, v in _models.__dict__.items() if isinstance(v, type)}
+
+
+@lru_cache(maxsize=None)
+def _get_shared_serializers() -> Tuple[Serializer, Deserializer]:
+    """Return the Serializer/Deserializer pair shared by all clients.
+
+    Neither object is mutated once configured, so every client and operation group can use the same pair.
+
+    :return: The shared serializer and deserializer.
+    :rtype: tuple[Serializer, Deserializer]
+    """
+    serialize = Serializer(_CLIENT_MODELS)
+    serialize.client_side_validation = False
+    return serialize, Deserializer(_CLIENT_MODELS)
+
+
+def _build_policies(
+    config: HybridComputeManagementClientConfiguration, priority_max_in_flight: Optional[int] = None, **kwargs: Any
+) -> List[Any]:
+    """Build the default policy chain for a client configuration.
+
+    Only the configuration is read here; the policies themselves are always new instances because
+    HTTP policies get linked to the pipeline they are placed in and can't be shared between clients.
+
+    :param config: The client configuration providing the configurable policies.
+    :type config: HybridComputeManagementClientConfiguration
+    :param int priority_max_in_flight: If given, a PriorityQueuePolicy caps in-flight requests at this many.
+    :return: The policies, in pipeline order, leaving out the ones that aren't configured.
+    :rtype: list
+    """
+    redirect_policy = config.redirect_policy
+    candidates = (
+        policies.RequestIdPolicy(**kwargs),
+        config.headers_policy,
+        config.user_agent_policy,
+        config.proxy_policy,
+        policies.ContentDecodePolicy(**kwargs),
+        ARMAutoResourceProviderRegistrationPolicy(),
+        redirect_policy,
+        PriorityQueuePolicy(priority_max_in_flight) if priority_max_in_flight is not None else None,
+        config.retry_policy,
+        config.authentication_policy,
+        config.custom_hook_policy,
+        config.logging_policy,
+        policies.DistributedTracingPolicy(**kwargs),
+        policies.SensitiveHeaderCleanupPolicy(**kwargs) if redirect_policy else None,
+        config.http_logging_policy,
+    )
+    return [policy for policy in candidates if policy is not None]
+
+
+class HybridComputeManagementClient(HybridComputeManagementClientGenerated):
+    __doc__ = HybridComputeManagementClientGenerated.__doc__
+
+    # Operation groups are created on first access rather than in __init__.
+    _OPERATION_GROUPS: Dict[str, type] = {
+        "licenses": LicensesOperations,
+        "machines": MachinesOperations,
+        "machine_extensions": MachineExtensionsOperations,
+        "extension_metadata": ExtensionMetadataOperations,
+        "operations": Operations,
+        "network_profile": NetworkProfileOperations,
+        "machine_run_commands": MachineRunCommandsOperations,
+        "gateways": GatewaysOperations,
+        "settings": SettingsOperations,
+        "private_link_scopes": PrivateLinkScopesOperations,
+        "private_link_resources": PrivateLinkResourcesOperations,
+        "private_endpoint_connections": PrivateEndpointConnectionsOperations,
+        "network_security_perimeter_configurations": NetworkSecurityPerimeterConfigurationsOperations,
+    }
+
+    def __init__(  # pylint: disable=super-init-not-called
+        self,
+        credential: "TokenCredential",
+        subscription_id: str,
+        base_url: str = "https://management.azure.com",
+        **kwargs: Any
+    ) -> None:
+        # With enable_request_debounce, concurrent GETs sent through _send_request within debounce_ms of
+        # each other are folded into a single /batch call of at most debounce_max requests. GETs carrying
+        # headers other than Accept are always sent on their own, since /batch can't forward them.
+        enable_request_debounce: bool = kwargs.pop("enable_request_debounce", False)
+        debounce_ms: int = kwargs.pop("debounce_ms", 100)
+        debounce_max: int = kwargs.pop("debounce_max", MAX_BATCH_SIZE)
+        if not 0 < debounce_max <= MAX_BATCH_SIZE:
+            raise ValueError("debounce_max must be between 1 and {}.".format(MAX_BATCH_SIZE))
+        # With priority_max_in_flight, at most that many requests are in flight and waiting calls passing
+        # priority="high" go ahead of those passing priority="low".
+        priority_max_in_flight: Optional[int] = kwargs.pop("priority_max_in_flight", None)
+        # The generated constructor isn't called: it would build every operation group and its own serializers
+        # up front. The configuration and pipeline are built the same way; test_policies_match_generated_client
+        # checks the policy chain against the generated constructor's.
+        self._config = HybridComputeManagementClientConfiguration(
+            credential=credential, subscription_id=subscription_id, **kwargs
+        )
+        _policies = kwargs.pop("policies", None)
+        if _policies is None:
+            _policies = _build_policies(self._config, priority_max_in_flight, **kwargs)
+        elif priority_max_in_flight is not None:
+            _policies = [PriorityQueuePolicy(priority_max_in_flight)] + list(_policies)
+        self._client: ARMPipelineClient = ARMPipelineClient(base_url=base_url, policies=_policies, **kwargs)
+
+        self._serialize, self._deserialize = _get_shared_serializers()
+
+        self._debouncer: Optional[RequestDebouncer] = None
+        if enable_request_debounce:
+            self._debouncer = RequestDebouncer(
+                lambda requests: self.send_batch_requests(requests, max_batch=debounce_max), debounce_ms, debounce_max
+            )
+
+    def __getattr__(self, name: str) -> Any:
+        operation_group = type(self)._OPERATION_GROUPS.get(name)
+        if operation_group is None:
+            raise AttributeError(
+                "'{}' object has no attribute '{}'".format(type(self).__name__, name)
+            )
+        operations = operation_group(self._client, self._config, self._serialize, self._deserialize)
+        self.__dict__[name] = operations
+        return operations
+
+    def _send_request(self, request: HttpRequest, *, stream: bool = False, **kwargs: Any) -> HttpResponse:
+        """Runs the network request through the client's chained policies.
+
+        >>> from azure.core.rest import HttpRequest
+        >>> request = HttpRequest("GET", "https://www.example.org/")
+        <HttpRequest [GET], url: 'https://www.example.org/'>
+        >>> response = client._send_request(request)
+        <HttpResponse: 200 OK>
+
+        For more information on this code flow, see https://aka.ms/azsdk/dpcodegen/python/send_request
+
+        :param request: The network request you want to make. Required.
+        :type request: ~azure.core.rest.HttpRequest
+        :keyword bool stream: Whether the response payload will be streamed. Defaults to False.
+        :return: The response of your network call. Does not do error handling on your response.
+        :rtype: ~azure.core.rest.HttpResponse
+        """
+        if self._debouncer is not None and not stream and not kwargs and is_batchable(request):
+            return self._debouncer.send(request, lambda: self._send_single_request(request, stream=stream))
+        return self._send_single_request(request, stream=stream, **kwargs)
+
+    def _send_single_request(self, request: HttpRequest, *, stream: bool = False, **kwargs: Any) -> HttpResponse:
+        # Only the url and headers are rewritten by the client and its policies, so the body is
+        # shared with the caller's request instead of being deep copied on every call.
+        request_copy = copy(request)
+        request_copy.headers = case_insensitive_dict(request.headers)
+        request_copy.url = self._client.format_url(request.url)
+        return self._client.send_request(request_copy, stream=stream, **kwargs)  # type: ignore
+
+    def send_batch_requests(
+        self, requests: List[HttpRequest], *, max_batch: int = MAX_BATCH_SIZE, **kwargs: Any
+    ) -> List[HttpResponse]:
+        """Send GET requests packed into calls to the ARM ``/batch`` endpoint.
+
+        Each call carries up to ``max_batch`` requests, so reading many resources costs one round trip
+        (and one throttling unit) per batch instead of one per resource.
+
+        >>> from azure.core.rest import HttpRequest
+        >>> requests = [HttpRequest("GET", machine_id + "?api-version=2024-03-31-preview") for machine_id in ids]
+        >>> responses = client.send_batch_requests(requests)
+
+        :param requests: The GET requests to send. Relative urls are resolved against the client's base url.
+        :type requests: list[~azure.core.rest.HttpRequest]
+        :keyword int max_batch: The maximum number of requests per batch call. Defaults to and can't exceed 20.
+        :return: One response per request, in the same order. Does not do error handling on these responses.
+            If a batch call itself fails, each of its requests gets that failure as its response.
+        :rtype: list[~azure.core.rest.HttpResponse]
+        :raises ValueError: If a request isn't a GET, has headers other than Accept, or max_batch is out of range.
+        :raises ~azure.core.exceptions.HttpResponseError: If a batch response is missing a request's result.
+        """
+        responses: List[HttpResponse] = []
+        for chunk in chunk_requests(requests, max_batch):
+            envelope = self._client.send_request(build_batch_request(self._client.format_url, chunk), **kwargs)
+            responses.extend(unpack_batch_response(envelope, chunk))
+        return responses
+
+
+__all__: List[str] = [
+    "HybridComputeManagementClient"
+]  # Add all objects you want publicly available to users at this package level
 
 
 def patch_sdk():
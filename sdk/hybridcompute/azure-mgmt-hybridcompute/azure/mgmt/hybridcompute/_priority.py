@@ -0,0 +1,67 @@
+# ------------------------------------
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+# ------------------------------------
+"""Pipeline policy letting interactive calls go ahead of background ones."""
+import heapq
+import itertools
+import threading
+from typing import Dict, List, Tuple
+
+from azure.core.pipeline import PipelineRequest, PipelineResponse
+from azure.core.pipeline.policies import SansIOHTTPPolicy
+
+DEFAULT_MAX_IN_FLIGHT = 16
+
+_PRIORITY_RANKS: Dict[str, int] = {"high": 0, "low": 1}
+_SLOT_KEY = "hybridcompute_priority_slot"
+
+
+class PriorityQueuePolicy(SansIOHTTPPolicy):
+    """Limits how many requests are in flight, admitting waiting requests by priority.
+
+    Each call can pass ``priority="high"`` (the default) or ``priority="low"``. When the limit is reached,
+    waiting high priority requests are admitted before low priority ones, and requests of the same
+    priority are admitted in the order they arrived. Place this policy before the retry policy so
+    a request holds its slot across retries.
+
+    :param int max_in_flight: How many requests may be in flight at once. Defaults to 16.
+    """
+
+    def __init__(self, max_in_flight: int = DEFAULT_MAX_IN_FLIGHT) -> None:
+        if max_in_flight < 1:
+            raise ValueError("priority_max_in_flight must be at least 1")
+        self._max_in_flight = max_in_flight
+        self._condition = threading.Condition()
+        self._waiting: List[Tuple[int, int]] = []
+        self._sequence = itertools.count()
+        self._in_flight = 0
+
+    def on_request(self, request: PipelineRequest) -> None:
+        priority = request.context.options.pop("priority", None) or "high"
+        try:
+            rank = _PRIORITY_RANKS[priority.lower()]
+        except KeyError:
+            raise ValueError("priority must be 'high' or 'low', got '{}'.".format(priority)) from None
+        ticket = (rank, next(self._sequence))
+        with self._condition:
+            heapq.heappush(self._waiting, ticket)
+            while self._in_flight >= self._max_in_flight or self._waiting[0] != ticket:
+                self._condition.wait()
+            heapq.heappop(self._waiting)
+            self._in_flight += 1
+            # The next ticket in line may be admitted too if there are slots left.
+            self._condition.notify_all()
+        request.context[_SLOT_KEY] = True
+
+    def on_response(self, request: PipelineRequest, response: PipelineResponse) -> None:
+        self._release(request)
+
+    def on_exception(self, request: PipelineRequest) -> None:
+        self._release(request)
+
+    def _release(self, request: PipelineRequest) -> None:
+        if request.context.pop(_SLOT_KEY, False):
+            with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
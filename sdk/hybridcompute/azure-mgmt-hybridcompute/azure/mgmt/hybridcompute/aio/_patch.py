@@ -6,9 +6,112 @@
 
 Follow our quickstart for examples: https://aka.ms/azsdk/python/dpcodegen/python/customize
 """
-from typing import List
+import asyncio
+from copy import copy
+from typing import Any, Awaitable, Iterable, List, Union
 
-__all__: List[str] = []  # Add all objects you want publicly available to users at this package level
+from azure.core.rest import AsyncHttpResponse, HttpRequest
+from azure.core.utils import case_insensitive_dict
+
+from .._batch import MAX_BATCH_SIZE, build_batch_request, chunk_requests, unpack_async_batch_response
+from ._hybrid_compute_management_client import (
+    HybridComputeManagementClient as HybridComputeManagementClientGenerated,
+)
+
+# Keeps bursts of concurrent calls below the point where ARM starts throttling them.
+MAX_CONCURRENCY = 32
+
+
+class HybridComputeManagementClient(HybridComputeManagementClientGenerated):
+    __doc__ = HybridComputeManagementClientGenerated.__doc__
+
+    def _send_request(
+        self, request: HttpRequest, *, stream: bool = False, **kwargs: Any
+    ) -> Awaitable[AsyncHttpResponse]:
+        """Runs the network request through the client's chained policies.
+
+        >>> from azure.core.rest import HttpRequest
+        >>> request = HttpRequest("GET", "https://www.example.org/")
+        <HttpRequest [GET], url: 'https://www.example.org/'>
+        >>> response = await client._send_request(request)
+        <AsyncHttpResponse: 200 OK>
+
+        To send many requests, pass the resulting awaitables to :meth:`send_many_async` rather than
+        awaiting them one at a time.
+
+        For more information on this code flow, see https://aka.ms/azsdk/dpcodegen/python/send_request
+
+        :param request: The network request you want to make. Required.
+        :type request: ~azure.core.rest.HttpRequest
+        :keyword bool stream: Whether the response payload will be streamed. Defaults to False.
+        :return: The response of your network call. Does not do error handling on your response.
+        :rtype: ~azure.core.rest.AsyncHttpResponse
+        """
+        # Only the url and headers are rewritten by the client and its policies, so the body is
+        # shared with the caller's request instead of being deep copied on every call.
+        request_copy = copy(request)
+        request_copy.headers = case_insensitive_dict(request.headers)
+        request_copy.url = self._client.format_url(request.url)
+        return self._client.send_request(request_copy, stream=stream, **kwargs)  # type: ignore
+
+    async def send_many_async(
+        self, coros: Iterable[Awaitable[Any]], *, max_concurrency: int = MAX_CONCURRENCY
+    ) -> List[Union[Any, BaseException]]:
+        """Run management calls concurrently, at most ``max_concurrency`` at a time.
+
+        Prefer this over awaiting calls one after another in a loop:
+
+        >>> results = await client.send_many_async(
+        ...     client.machines.get(resource_group, name) for name in machine_names
+        ... )
+
+        :param coros: The awaitables to run, such as operation group calls or :meth:`_send_request` results.
+        :type coros: Iterable[Awaitable]
+        :keyword int max_concurrency: How many calls may be in flight at once. Defaults to 32.
+        :return: The results in the order of ``coros``. A call that failed has its exception in its place.
+        :rtype: list
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _bounded(coro: Awaitable[Any]) -> Any:
+            async with semaphore:
+                return await coro
+
+        return await asyncio.gather(*[_bounded(coro) for coro in coros], return_exceptions=True)
+
+    async def send_batch_requests(
+        self, requests: List[HttpRequest], *, max_batch: int = MAX_BATCH_SIZE, **kwargs: Any
+    ) -> List[AsyncHttpResponse]:
+        """Send GET requests packed into calls to the ARM ``/batch`` endpoint.
+
+        Each call carries up to ``max_batch`` requests and the calls are sent concurrently, so reading
+        many resources costs one round trip (and one throttling unit) per batch instead of one per resource.
+
+        >>> from azure.core.rest import HttpRequest
+        >>> requests = [HttpRequest("GET", machine_id + "?api-version=2024-03-31-preview") for machine_id in ids]
+        >>> responses = await client.send_batch_requests(requests)
+
+        :param requests: The GET requests to send. Relative urls are resolved against the client's base url.
+        :type requests: list[~azure.core.rest.HttpRequest]
+        :keyword int max_batch: The maximum number of requests per batch call. Defaults to and can't exceed 20.
+        :return: One response per request, in the same order. Does not do error handling on these responses.
+            If a batch call itself fails, each of its requests gets that failure as its response.
+        :rtype: list[~azure.core.rest.AsyncHttpResponse]
+        :raises ValueError: If a request isn't a GET, has headers other than Accept, or max_batch is out of range.
+        :raises ~azure.core.exceptions.HttpResponseError: If a batch response is missing a request's result.
+        """
+
+        async def _send_chunk(chunk: List[HttpRequest]) -> List[AsyncHttpResponse]:
+            envelope = await self._client.send_request(build_batch_request(self._client.format_url, chunk), **kwargs)
+            return unpack_async_batch_response(envelope, chunk)
+
+        chunks = await asyncio.gather(*[_send_chunk(chunk) for chunk in chunk_requests(requests, max_batch)])
+        return [response for chunk in chunks for response in chunk]
+
+
+__all__: List[str] = [
+    "HybridComputeManagementClient"
+]  # Add all objects you want publicly available to users at this package level
 
 
 def patch_sdk():
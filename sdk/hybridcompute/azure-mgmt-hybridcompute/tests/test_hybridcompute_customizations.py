@@ -0,0 +1,365 @@
+# ------------------------------------
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+# ------------------------------------
+"""Tests of the hand-written client customizations, run against a fake transport."""
+import json
+import threading
+from unittest import mock
+
+import pytest
+from azure.core.credentials import AccessToken
+from azure.core.pipeline import PipelineContext, PipelineRequest
+from azure.core.pipeline.policies import RetryPolicy
+from azure.core.pipeline.transport import AsyncHttpTransport, HttpTransport
+from azure.core.rest import HttpRequest
+from azure.core.rest._http_response_impl import HttpResponseImpl
+from azure.core.rest._http_response_impl_async import AsyncHttpResponseImpl
+
+from azure.mgmt.hybridcompute import HybridComputeManagementClient
+from azure.mgmt.hybridcompute._configuration import HybridComputeManagementClientConfiguration
+from azure.mgmt.hybridcompute._debounce import RequestDebouncer
+from azure.mgmt.hybridcompute._hybrid_compute_management_client import (
+    HybridComputeManagementClient as HybridComputeManagementClientGenerated,
+)
+from azure.mgmt.hybridcompute._patch import _build_policies
+from azure.mgmt.hybridcompute._priority import PriorityQueuePolicy
+from azure.mgmt.hybridcompute.operations import MachinesOperations
+from azure.mgmt.hybridcompute.aio import HybridComputeManagementClient as AsyncHybridComputeManagementClient
+from azure.mgmt.hybridcompute.operations._machines_operations import build_get_request
+
+SUBSCRIPTION_ID = "00000000-0000-0000-0000-000000000000"
+
+
+def _build_response(response_type, request, status_code, body, headers=None):
+    headers = dict(headers or {}, **{"Content-Type": "application/json"})
+    response = response_type(
+        request=request,
+        internal_response=mock.Mock(),
+        status_code=status_code,
+        reason="",
+        content_type="application/json",
+        headers=headers,
+        stream_download_generator=None,
+    )
+    response._content = json.dumps(body).encode("utf-8")
+    return response
+
+
+class FakeTransport(HttpTransport):
+    """Answers every request with ``handler(request)``, a (status code, JSON body) pair, and records the requests."""
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.requests = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        status_code, body = self.handler(request)
+        return _build_response(HttpResponseImpl, request, status_code, body)
+
+
+class AsyncFakeTransport(AsyncHttpTransport):
+    def __init__(self, handler):
+        self.handler = handler
+        self.requests = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    async def open(self):
+        pass
+
+    async def close(self):
+        pass
+
+    async def send(self, request, **kwargs):
+        self.requests.append(request)
+        status_code, body = self.handler(request)
+        return _build_response(AsyncHttpResponseImpl, request, status_code, body)
+
+
+class FakeCredential:
+    def get_token(self, *_, **__):
+        return AccessToken("fake-token", 2**40)
+
+
+class AsyncFakeCredential:
+    async def get_token(self, *_, **__):
+        return AccessToken("fake-token", 2**40)
+
+
+def _echo_batch(request):
+    """Answers a /batch call with each packed request's url as its content."""
+    items = json.loads(request.content)["requests"]
+    return 200, {
+        "responses": [
+            {"name": item["name"], "httpStatusCode": 200, "content": {"url": item["url"]}} for item in items
+        ]
+    }
+
+
+def test_operation_groups_created_on_first_access():
+    transport = FakeTransport(lambda request: (200, {"value": []}))
+    client = HybridComputeManagementClient(FakeCredential(), SUBSCRIPTION_ID, transport=transport)
+    other_client = HybridComputeManagementClient(FakeCredential(), SUBSCRIPTION_ID, transport=transport)
+    assert client._config.subscription_id == SUBSCRIPTION_ID
+    assert all(name not in vars(client) for name in client._OPERATION_GROUPS)
+
+    machines = client.machines
+    assert isinstance(machines, MachinesOperations)
+    assert client.machines is machines
+    assert vars(client)["machines"] is machines
+    assert "licenses" not in vars(client)
+    # operation groups use the serializers every client shares
+    assert machines._serialize is client._serialize is other_client._serialize
+    assert list(machines.list_by_resource_group("rg")) == []
+    assert "/resourceGroups/rg/" in transport.requests[0].url
+
+    with pytest.raises(AttributeError):
+        client.not_an_operation_group
+
+
+def _pipeline_policy_types(client):
+    # SansIO policies are wrapped in a runner
+    return [type(getattr(policy, "_policy", policy)) for policy in client._client._pipeline._impl_policies]
+
+
+def test_generated_constructor_not_called():
+    with mock.patch.object(
+        HybridComputeManagementClientGenerated, "__init__", side_effect=AssertionError("generated __init__ called")
+    ):
+        client = HybridComputeManagementClient(FakeCredential(), SUBSCRIPTION_ID, transport=FakeTransport(None))
+    assert client._config.subscription_id == SUBSCRIPTION_ID
+
+
+def test_policies_match_generated_client():
+    """The client builds its pipeline itself, so it must keep the generated constructor's policies and their order"""
+    client = HybridComputeManagementClient(FakeCredential(), SUBSCRIPTION_ID, transport=FakeTransport(None))
+    generated = HybridComputeManagementClientGenerated(FakeCredential(), SUBSCRIPTION_ID, transport=FakeTransport(None))
+    assert _pipeline_policy_types(client) == _pipeline_policy_types(generated)
+
+
+def test_unconfigured_policies_left_out():
+    default_count = len(_build_policies(HybridComputeManagementClientConfiguration(FakeCredential(), SUBSCRIPTION_ID)))
+    config = HybridComputeManagementClientConfiguration(FakeCredential(), SUBSCRIPTION_ID)
+    config.redirect_policy = None
+    config.custom_hook_policy = None
+
+    policies = _build_policies(config)
+    assert None not in policies
+    # no redirect, custom hook or sensitive header cleanup policy
+    assert len(policies) == default_count - 3
+
+
+def test_serializers_not_built_per_client():
+    HybridComputeManagementClient(FakeCredential(), SUBSCRIPTION_ID, transport=FakeTransport(None))  # warm the cache
+    with mock.patch("azure.mgmt.hybridcompute._patch.Serializer") as serializer, mock.patch(
+        "azure.mgmt.hybridcompute._patch.Deserializer"
+    ) as deserializer:
+        first = HybridComputeManagementClient(FakeCredential(), SUBSCRIPTION_ID, transport=FakeTransport(None))
+        second = HybridComputeManagementClient(FakeCredential(), SUBSCRIPTION_ID, transport=FakeTransport(None))
+    assert serializer.call_count == deserializer.call_count == 0
+    assert first._serialize is second._serialize
+    assert first._deserialize is second._deserialize
+
+
+def test_send_batch_requests():
+    transport = FakeTransport(_echo_batch)
+    client = HybridComputeManagementClient(FakeCredential(), SUBSCRIPTION_ID, transport=transport)
+    requests = [HttpRequest("GET", "/machines/{}".format(i)) for i in range(3)]
+    requests.append(build_get_request("rg", "machine", SUBSCRIPTION_ID))  # generated requests only set Accept
+
+    responses = client.send_batch_requests(requests, max_batch=2)
+    assert len(transport.requests) == 2
+    assert all(request.url.startswith("https://management.azure.com/batch?") for request in transport.requests)
+    assert [response.json()["url"] for response in responses] == [
+        "https://management.azure.com/machines/0",
+        "https://management.azure.com/machines/1",
+        "https://management.azure.com/machines/2",
+        "https://management.azure.com" + requests[3].url,
+    ]
+
+
+def test_send_batch_requests_refuses_headers():
+    """/batch entries can't carry headers, so a request that has any besides Accept isn't batched"""
+    transport = FakeTransport(_echo_batch)
+    client = HybridComputeManagementClient(FakeCredential(), SUBSCRIPTION_ID, transport=transport)
+    request = HttpRequest("GET", "/machines/0", headers={"If-None-Match": '"etag"'})
+
+    with pytest.raises(ValueError):
+        client.send_batch_requests([HttpRequest("GET", "/machines/1"), request])
+    assert not transport.requests
+
+
+def test_send_batch_requests_failed_batch():
+    """A failed batch call is returned as the response of each request it carried"""
+    transport = FakeTransport(lambda _: (429, {"error": {"code": "TooManyRequests"}}))
+    client = HybridComputeManagementClient(FakeCredential(), SUBSCRIPTION_ID, transport=transport, retry_total=0)
+
+    responses = client.send_batch_requests([HttpRequest("GET", "/machines/{}".format(i)) for i in range(2)])
+    assert [response.status_code for response in responses] == [429, 429]
+    assert all(response.json()["error"]["code"] == "TooManyRequests" for response in responses)
+
+
+@pytest.mark.asyncio
+async def test_send_batch_requests_async():
+    transport = AsyncFakeTransport(_echo_batch)
+    client = AsyncHybridComputeManagementClient(AsyncFakeCredential(), SUBSCRIPTION_ID, transport=transport)
+
+    responses = await client.send_batch_requests([HttpRequest("GET", "/machines/{}".format(i)) for i in range(3)])
+    assert [response.json()["url"] for response in responses] == [
+        "https://management.azure.com/machines/{}".format(i) for i in range(3)
+    ]
+
+    transport.handler = lambda _: (503, {"error": {"code": "ServiceUnavailable"}})
+    responses = await client.send_batch_requests([HttpRequest("GET", "/machines/0")], retry_total=0)
+    assert [response.status_code for response in responses] == [503]
+
+
+def _send_concurrently(debouncer, requests):
+    """Sends each request from its own thread, returning the responses in order"""
+    responses = [None] * len(requests)
+
+    def send(index):
+        responses[index] = debouncer.send(requests[index], lambda: "sent alone")
+
+    threads = [threading.Thread(target=send, args=(index,)) for index in range(len(requests))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    return responses
+
+
+def test_debouncer_sends_lone_request_directly():
+    send_batch = mock.Mock()
+    debouncer = RequestDebouncer(send_batch, delay_ms=10, max_batch=20)
+
+    assert debouncer.send(HttpRequest("GET", "/machines/0"), lambda: "sent alone") == "sent alone"
+    assert send_batch.call_count == 0
+
+
+def test_debouncer_flushes_full_batch():
+    batches = []
+
+    def send_batch(requests):
+        batches.append(requests)
+        return [request.url for request in requests]
+
+    # with a watermark of 1 every request waits; the delay is long enough that only a full batch gets sent
+    debouncer = RequestDebouncer(send_batch, delay_ms=60000, max_batch=3, watermark=1)
+    requests = [HttpRequest("GET", "/machines/{}".format(i)) for i in range(3)]
+
+    assert _send_concurrently(debouncer, requests) == [request.url for request in requests]
+    assert len(batches) == 1
+    assert sorted(request.url for request in batches[0]) == [request.url for request in requests]
+
+
+def test_debouncer_flushes_after_delay():
+    send_batch = mock.Mock(side_effect=lambda requests: [request.url for request in requests])
+    debouncer = RequestDebouncer(send_batch, delay_ms=10, max_batch=20, watermark=1)
+
+    assert _send_concurrently(debouncer, [HttpRequest("GET", "/machines/0")]) == ["/machines/0"]
+    assert send_batch.call_count == 1
+
+
+def test_debouncer_flush():
+    send_batch = mock.Mock(side_effect=lambda requests: [request.url for request in requests])
+    debouncer = RequestDebouncer(send_batch, delay_ms=60000, max_batch=20, watermark=1)
+    responses = []
+    thread = threading.Thread(target=lambda: responses.append(debouncer.send(HttpRequest("GET", "/machines/0"), None)))
+    thread.start()
+    while not send_batch.call_count:
+        debouncer.flush()
+        thread.join(0.01)
+    thread.join(5)
+    assert responses == ["/machines/0"]
+
+
+def test_debounced_request_with_headers_is_sent_alone():
+    transport = FakeTransport(lambda request: (200, {"url": request.url}))
+    client = HybridComputeManagementClient(
+        FakeCredential(), SUBSCRIPTION_ID, transport=transport, enable_request_debounce=True
+    )
+    client._debouncer._watermark = 1  # debounce every request rather than only concurrent ones
+
+    response = client._send_request(HttpRequest("GET", "/machines/0", headers={"If-None-Match": '"etag"'}))
+    assert response.json() == {"url": "https://management.azure.com/machines/0"}
+    assert transport.requests[0].headers["If-None-Match"] == '"etag"'
+
+
+def _policy_index(client, policy_type):
+    """Position of the first policy of the given type in the client's pipeline, or -1 if there's none"""
+    for index, policy in enumerate(client._client._pipeline._impl_policies):
+        if isinstance(getattr(policy, "_policy", policy), policy_type):  # SansIO policies are wrapped in a runner
+            return index
+    return -1
+
+
+def test_priority_queue_is_opt_in():
+    client = HybridComputeManagementClient(FakeCredential(), SUBSCRIPTION_ID, transport=FakeTransport(None))
+    assert _policy_index(client, PriorityQueuePolicy) == -1
+
+    client = HybridComputeManagementClient(
+        FakeCredential(), SUBSCRIPTION_ID, transport=FakeTransport(None), priority_max_in_flight=4
+    )
+    # ahead of the retry policy, so that a retried request keeps its slot
+    assert 0 <= _policy_index(client, PriorityQueuePolicy) < _policy_index(client, RetryPolicy)
+
+
+def test_priority_queue_admits_high_priority_first():
+    policy = PriorityQueuePolicy(1)
+    admitted = []
+
+    def pipeline_request(priority):
+        return PipelineRequest(HttpRequest("GET", "/" + priority), PipelineContext(None, priority=priority))
+
+    first = pipeline_request("high")
+    policy.on_request(first)  # holds the only slot
+
+    def send(priority):
+        request = pipeline_request(priority)
+        policy.on_request(request)
+        admitted.append(priority)
+        policy.on_response(request, None)
+
+    low = threading.Thread(target=send, args=("low",))
+    low.start()
+    while not policy._waiting:
+        low.join(0.01)
+    high = threading.Thread(target=send, args=("high",))
+    high.start()
+    while len(policy._waiting) < 2:
+        high.join(0.01)
+
+    policy.on_response(first, None)
+    low.join(5)
+    high.join(5)
+    assert admitted == ["high", "low"]
+
+    with pytest.raises(ValueError):
+        policy.on_request(pipeline_request("medium"))
+
+
+@pytest.mark.parametrize("debounce_max", [0, 21])
+def test_debounce_max_out_of_range(debounce_max):
+    with pytest.raises(ValueError):
+        HybridComputeManagementClient(
+            FakeCredential(), SUBSCRIPTION_ID, enable_request_debounce=True, debounce_max=debounce_max
+        )
@@ -29,6 +29,19 @@ from ._polling import CreateCertificatePoller
 NO_SAN_OR_SUBJECT = "You need to set either subject or one of the subject alternative names parameters in the policy"
 
 
+# Page callbacks for the list methods: items are wrapped lazily as the caller iterates rather than a page at a time
+def _deleted_certificates_from_items(objs):
+    return map(DeletedCertificate._from_deleted_certificate_item, objs)  # pylint:disable=protected-access
+
+
+def _certificate_properties_from_items(objs):
+    return map(CertificateProperties._from_certificate_item, objs)  # pylint:disable=protected-access
+
+
+def _issuer_properties_from_items(objs):
+    return map(IssuerProperties._from_issuer_item, objs)  # pylint:disable=protected-access
+
+
 class CertificateClient(KeyVaultClientBase):
     """A high-level interface for managing a vault's certificates.
 
@@ -91,7 +104,7 @@ class CertificateClient(KeyVaultClientBase):
                 :caption: Create a certificate
                 :dedent: 8
         """
-        if not (policy.san_emails or policy.san_user_principal_names or policy.san_dns_names or policy.subject):
+        if not policy._has_san_or_subject():
             raise ValueError(NO_SAN_OR_SUBJECT)
 
         polling_interval = kwargs.pop("_polling_interval", None)
@@ -105,7 +118,7 @@ class CertificateClient(KeyVaultClientBase):
             attributes = None
 
         parameters = self._models.CertificateCreateParameters(
-            certificate_policy=policy._to_certificate_policy_bundle(),
+            certificate_policy=policy._get_cached_policy_bundle(),
             certificate_attributes=attributes,
             tags=kwargs.pop("tags", None),
         )
@@ -382,7 +395,7 @@ class CertificateClient(KeyVaultClientBase):
         parameters = self._models.CertificateImportParameters(
             base64_encoded_certificate=base64_encoded_certificate,
             password=kwargs.pop("password", None),
-            certificate_policy=policy._to_certificate_policy_bundle() if policy else None,
+            certificate_policy=policy._get_cached_policy_bundle() if policy else None,
             certificate_attributes=attributes,
             tags=kwargs.pop("tags", None),
         )
@@ -430,7 +443,7 @@ class CertificateClient(KeyVaultClientBase):
         bundle = self._client.update_certificate_policy(
             vault_base_url=self.vault_url,
             certificate_name=certificate_name,
-            certificate_policy=policy._to_certificate_policy_bundle(),
+            certificate_policy=policy._get_cached_policy_bundle(),
             **kwargs
         )
         return CertificatePolicy._from_certificate_policy_bundle(certificate_policy_bundle=bundle)
@@ -582,9 +595,7 @@ class CertificateClient(KeyVaultClientBase):
         return self._client.get_deleted_certificates(
             vault_base_url=self._vault_url,
             maxresults=max_page_size,
-            cls=lambda objs: [
-                DeletedCertificate._from_deleted_certificate_item(deleted_certificate_item=x) for x in objs
-            ],
+            cls=_deleted_certificates_from_items,
             **kwargs
         )
 
@@ -627,7 +638,7 @@ class CertificateClient(KeyVaultClientBase):
         return self._client.get_certificates(
             vault_base_url=self._vault_url,
             maxresults=max_page_size,
-            cls=lambda objs: [CertificateProperties._from_certificate_item(certificate_item=x) for x in objs],
+            cls=_certificate_properties_from_items,
             **kwargs
         )
 
@@ -659,7 +670,7 @@ class CertificateClient(KeyVaultClientBase):
             vault_base_url=self._vault_url,
             certificate_name=certificate_name,
             maxresults=max_page_size,
-            cls=lambda objs: [CertificateProperties._from_certificate_item(certificate_item=x) for x in objs],
+            cls=_certificate_properties_from_items,
             **kwargs
         )
 
@@ -1038,7 +1049,7 @@ class CertificateClient(KeyVaultClientBase):
         return self._client.get_certificate_issuers(
             vault_base_url=self.vault_url,
             maxresults=max_page_size,
-            cls=lambda objs: [IssuerProperties._from_issuer_item(issuer_item=x) for x in objs],
+            cls=_issuer_properties_from_items,
             **kwargs
         )
 
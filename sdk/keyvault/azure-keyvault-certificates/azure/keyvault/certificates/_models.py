@@ -4,7 +4,7 @@
 # ------------------------------------
 # pylint: disable=too-many-lines,too-many-public-methods
 from datetime import datetime
-from typing import Any, Dict, Optional, Union, List
+from typing import Any, Dict, Optional, Tuple, Union, List
 
 from ._generated import models
 from ._shared import parse_key_vault_id
@@ -703,6 +703,7 @@ class CertificatePolicy(object):
         self._san_emails = kwargs.pop("san_emails", None) or None
         self._san_dns_names = kwargs.pop("san_dns_names", None) or None
         self._san_user_principal_names = kwargs.pop("san_user_principal_names", None) or None
+        self._bundle_cache: Optional[Tuple[Tuple[Any, ...], models.CertificatePolicy]] = None
 
     @classmethod
     def get_default(cls) -> "CertificatePolicy":
@@ -711,6 +712,31 @@ class CertificatePolicy(object):
     def __repr__(self) -> str:
         return f"<CertificatePolicy [issuer_name: {self.issuer_name}]>"[:1024]
 
+    def _has_san_or_subject(self) -> bool:
+        # Key Vault can't create a certificate whose policy has neither a subject nor a subject alternative name.
+        # Not cached: the SAN lists are mutable in place.
+        return bool(self._subject or self._san_emails or self._san_user_principal_names or self._san_dns_names)
+
+    def _bundle_state(self) -> Tuple[Any, ...]:
+        # lists are returned by the properties, so they can change in place and are compared by content
+        state = tuple(
+            tuple(value) if isinstance(value, list) else value
+            for name, value in self.__dict__.items()
+            if name != "_bundle_cache"
+        )
+        return state + (self.enabled, self.created_on, self.updated_on)
+
+    def _get_cached_policy_bundle(self) -> models.CertificatePolicy:
+        """Return the generated policy model, rebuilding it only if the policy changed since it was last built.
+
+        :returns: The generated model for this policy.
+        :rtype: ~azure.keyvault.certificates._generated.models.CertificatePolicy
+        """
+        state = self._bundle_state()
+        if self._bundle_cache is None or self._bundle_cache[0] != state:
+            self._bundle_cache = (state, self._to_certificate_policy_bundle())
+        return self._bundle_cache[1]
+
     def _to_certificate_policy_bundle(self) -> models.CertificatePolicy:
         if self.issuer_name or self.certificate_type or self.certificate_transparency:
             issuer_parameters: Optional[models.IssuerParameters] = models.IssuerParameters(
@@ -31,7 +31,7 @@ class AsyncDeleteRecoverPollingMethod(AsyncPollingMethod):
     :param final_resource: The final resource returned by the polling operation.
     :type final_resource: Any
     :param bool finished: Whether or not the polling operation is completed.
-    :param int interval: The polling interval, in seconds.
+    :param float interval: The polling interval, in seconds.
     """
 
     def __init__(
@@ -40,7 +40,7 @@ class AsyncDeleteRecoverPollingMethod(AsyncPollingMethod):
             command: Callable,
             final_resource: Any,
             finished: bool,
-            interval: int = 2
+            interval: float = 2
         ) -> None:
         self._pipeline_response = pipeline_response
         self._command = command
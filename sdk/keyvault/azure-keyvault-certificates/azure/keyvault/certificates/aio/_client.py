@@ -3,14 +3,17 @@
 # Licensed under the MIT License.
 # ------------------------------------
 # pylint:disable=too-many-lines,too-many-public-methods
-import base64
-from typing import Any, Optional, List, Union
-from functools import partial
+import asyncio
+import random
+import time
+from typing import Any, Coroutine, Dict, Iterable, Optional, List, Tuple, TypeVar, Union
 
+from azure.core.pipeline.transport import AsyncHttpTransport
 from azure.core.polling import AsyncLROPoller
 from azure.core.tracing.decorator import distributed_trace
 from azure.core.tracing.decorator_async import distributed_trace_async
 from azure.core.async_paging import AsyncItemPaged
+from azure.core.credentials_async import AsyncTokenCredential
 
 from .. import (
     KeyVaultCertificate,
@@ -22,11 +25,114 @@ from .. import (
     CertificateIssuer,
     IssuerProperties,
 )
+from ._concurrency_policy import AsyncConcurrencyLimitPolicy
 from ._polling_async import CreateCertificatePollerAsync
-from .._client import NO_SAN_OR_SUBJECT
+from .._client import (
+    NO_SAN_OR_SUBJECT,
+    _certificate_properties_from_items,
+    _deleted_certificates_from_items,
+    _issuer_properties_from_items,
+)
 from .._shared import AsyncKeyVaultClientBase
 from .._shared._polling_async import AsyncDeleteRecoverPollingMethod
 
+T = TypeVar("T")
+
+try:
+    from pybase64 import b64encode_as_string as _b64encode  # SIMD-accelerated, returns str directly
+except ImportError:
+
+    def _b64encode(data: bytes) -> str:
+        from base64 import b64encode  # only import_certificate encodes, so the module is imported on first use
+
+        return b64encode(data).decode("ascii")
+
+
+def _no_op(*_, **__) -> Any:  # The deserialization callback is ignored based on polling implementation
+    pass
+
+
+# Callback handed to the generated client's long-running operations as ``cls``
+def _response_and_deserialized(pipeline_response, deserialized, _):
+    return pipeline_response, deserialized
+
+
+def _pop_polling_interval(kwargs: Dict[str, Any], default: float, jitter: float) -> float:
+    # Tests pass 0 during playback, so only a missing interval gets the default. The default is jittered to keep
+    # clients that start together from polling the vault in lockstep.
+    interval = kwargs.pop("_polling_interval", None)
+    return default + random.uniform(0, jitter) if interval is None else interval
+
+
+# how many requests the bulk methods keep in flight unless told otherwise
+_BULK_MAX_CONCURRENCY = 16
+
+
+async def _gather_bounded(coros: Iterable[Coroutine[Any, Any, T]], max_concurrency: int) -> List[T]:
+    # Once a coroutine raises, those not yet started are closed without running, and the first error is raised after
+    # the ones already started have completed. Cancelling the call cancels all of them.
+    semaphore = asyncio.Semaphore(max_concurrency)
+    errors: List[Exception] = []
+
+    async def run(coro: Coroutine[Any, Any, T]) -> Optional[T]:
+        try:
+            async with semaphore:
+                if not errors:
+                    return await coro
+        except Exception as ex:  # pylint:disable=broad-except
+            errors.append(ex)
+        finally:
+            coro.close()  # no-op if the coroutine ran; otherwise keeps it from warning it was never awaited
+        return None
+
+    results = await asyncio.gather(*(run(coro) for coro in coros))
+    if errors:
+        raise errors[0]
+    return results  # type: ignore[return-value]
+
+
+# certificates larger than this are base64-encoded in a worker thread to keep the event loop responsive
+_EXECUTOR_ENCODE_THRESHOLD = 256 * 1024
+
+
+async def _encode_certificate(certificate_bytes: bytes) -> str:
+    if len(certificate_bytes) > _EXECUTOR_ENCODE_THRESHOLD:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:  # not running on asyncio, e.g. trio
+            pass
+        else:
+            return await loop.run_in_executor(None, _b64encode, certificate_bytes)
+    return _b64encode(certificate_bytes)
+
+
+class _SharedAsyncTransport(AsyncHttpTransport):
+    """Wrapper that keeps a client from opening or closing a transport it shares with other clients.
+
+    The wrapped transport still opens itself on first send; closing it is left to its owner.
+    """
+
+    def __init__(self, transport: AsyncHttpTransport) -> None:
+        self._transport = transport
+
+    async def send(self, request, **kwargs):
+        return await self._transport.send(request, **kwargs)
+
+    async def sleep(self, duration):
+        await self._transport.sleep(duration)
+
+    async def open(self):
+        pass
+
+    async def close(self):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):  # pylint: disable=arguments-differ
+        pass
+
 
 class CertificateClient(AsyncKeyVaultClientBase):
     """A high-level asynchronous interface for managing a vault's certificates.
@@ -42,6 +148,26 @@ class CertificateClient(AsyncKeyVaultClientBase):
     :paramtype api_version: ~azure.keyvault.certificates.ApiVersion or str
     :keyword bool verify_challenge_resource: Whether to verify the authentication challenge resource matches the Key
         Vault domain. Defaults to True.
+    :keyword transport: The transport used to send requests. A single transport, such as one
+        :class:`~azure.core.pipeline.transport.AioHttpTransport`, can be shared by many clients so that they reuse the
+        same connections.
+    :paramtype transport: ~azure.core.pipeline.transport.AsyncHttpTransport
+    :keyword bool session_owner: Whether the client owns ``transport`` and closes it when the client is closed.
+        Pass False when ``transport`` is shared with other clients; it's then up to the caller to close it. Defaults
+        to True.
+    :keyword float policy_cache_ttl: How many seconds :func:`get_certificate_policy` may reuse a policy it already
+        fetched. Policies created, imported, updated, or deleted through this client are refetched. Defaults to None,
+        which disables caching.
+    :keyword float cert_cache_ttl: How many seconds :func:`get_certificate` and :func:`get_certificate_version` may
+        reuse a certificate they already fetched. Certificates changed through this client are refetched. Defaults to
+        None, which disables caching.
+    :keyword int max_concurrent_requests: How many requests the client may have in flight at once. Further requests
+        wait for one of those to complete rather than being sent and throttled by the vault. Defaults to None, which
+        doesn't limit concurrency.
+
+    The client holds open connections until it's closed, so close it when it's no longer needed, either by calling
+    :func:`close` or by using it as an async context manager: ``async with CertificateClient(...) as client:``.
+    Closing a client created with ``session_owner=False`` leaves its shared transport open.
 
     Example:
         .. literalinclude:: ../tests/test_examples_certificates_async.py
@@ -53,6 +179,79 @@ class CertificateClient(AsyncKeyVaultClientBase):
     """
 
     # pylint:disable=protected-access
+    def __init__(self, vault_url: str, credential: AsyncTokenCredential, **kwargs: Any) -> None:
+        self._policy_cache_ttl: Optional[float] = kwargs.pop("policy_cache_ttl", None)
+        # lowercased certificate name -> (time fetched, policy bundle); certificate names are case-insensitive
+        self._policy_cache: Dict[str, Tuple[float, Any]] = {}
+        self._cert_cache_ttl: Optional[float] = kwargs.pop("cert_cache_ttl", None)
+        # lowercased certificate name -> lowercased version ("" for the latest) -> (time fetched, certificate bundle)
+        self._cert_cache: Dict[str, Dict[str, Tuple[float, Any]]] = {}
+        self._cert_requests_in_flight: Dict[Tuple[str, str], "asyncio.Task[Any]"] = {}
+        # with session_owner=False the transport is shared with other clients, so closing this one leaves it open
+        # without a transport, session_owner is left for azure-core's default AioHttpTransport to consume
+        if kwargs.get("transport") is not None and not kwargs.pop("session_owner", True):
+            kwargs["transport"] = _SharedAsyncTransport(kwargs["transport"])
+        max_concurrent_requests = kwargs.pop("max_concurrent_requests", None)
+        if max_concurrent_requests is not None:
+            # per-call policies run ahead of the retry policy, so a retried request keeps its slot
+            per_call_policies = kwargs.pop("per_call_policies", None) or []
+            if not isinstance(per_call_policies, list):
+                per_call_policies = [per_call_policies]
+            kwargs["per_call_policies"] = [AsyncConcurrencyLimitPolicy(max_concurrent_requests)] + per_call_policies
+        super().__init__(vault_url, credential, **kwargs)
+        # these request models are never modified once built, so every request shares the same instances
+        self._enabled_attributes = {
+            True: self._models.CertificateAttributes(enabled=True),
+            False: self._models.CertificateAttributes(enabled=False),
+        }
+        self._cancel_operation_parameter = self._models.CertificateOperationUpdateParameter(
+            cancellation_requested=True
+        )
+
+    def _invalidate_cached(self, certificate_name: str) -> None:
+        self._policy_cache.pop(certificate_name.lower(), None)
+        self._cert_cache.pop(certificate_name.lower(), None)
+
+    async def _get_certificate_bundle(self, certificate_name: str, version: str, **kwargs: Any) -> Any:
+        key = (certificate_name.lower(), version.lower())
+        if self._cert_cache_ttl:
+            cached = self._cert_cache.get(key[0], {}).get(key[1])
+            if cached and time.monotonic() - cached[0] < self._cert_cache_ttl:
+                return cached[1]
+
+        # concurrent requests for the same certificate share one GET; requests with options of their own don't
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:  # not running on asyncio, e.g. trio
+            loop = None
+        if kwargs or loop is None:
+            return await self._fetch_certificate_bundle(certificate_name, version, **kwargs)
+
+        # the GET runs in a task of its own so that a cancelled caller doesn't cancel it for the others waiting on it
+        in_flight = self._cert_requests_in_flight.get(key)
+        if in_flight is None:
+            in_flight = loop.create_task(self._fetch_certificate_bundle(certificate_name, version))
+            self._cert_requests_in_flight[key] = in_flight
+            in_flight.add_done_callback(lambda task: self._cert_request_done(key, task))
+        return await asyncio.shield(in_flight)
+
+    def _cert_request_done(self, key: Tuple[str, str], task: "asyncio.Task[Any]") -> None:
+        if self._cert_requests_in_flight.get(key) is task:
+            del self._cert_requests_in_flight[key]
+        if not task.cancelled():
+            task.exception()  # mark any exception retrieved in case every caller was cancelled before it was raised
+
+    async def _fetch_certificate_bundle(self, certificate_name: str, version: str, **kwargs: Any) -> Any:
+        bundle = await self._client.get_certificate(
+            vault_base_url=self.vault_url,
+            certificate_name=certificate_name,
+            certificate_version=version,
+            **kwargs
+        )
+        if self._cert_cache_ttl:
+            self._cert_cache.setdefault(certificate_name.lower(), {})[version.lower()] = (time.monotonic(), bundle)
+        return bundle
+
     @distributed_trace_async
     async def create_certificate(
         self, certificate_name: str, policy: CertificatePolicy, **kwargs: Any
@@ -87,47 +286,43 @@ class CertificateClient(AsyncKeyVaultClientBase):
                 :caption: Create a certificate
                 :dedent: 8
         """
-        if not (policy.san_emails or policy.san_user_principal_names or policy.san_dns_names or policy.subject):
+        if not policy._has_san_or_subject():
             raise ValueError(NO_SAN_OR_SUBJECT)
 
-        polling_interval = kwargs.pop("_polling_interval", None)
-        if polling_interval is None:
-            polling_interval = 5
+        polling_interval = _pop_polling_interval(kwargs, 5, jitter=1.5)
         enabled = kwargs.pop("enabled", None)
 
-        if enabled is not None:
-            attributes = self._models.CertificateAttributes(enabled=enabled)
-        else:
-            attributes = None
+        attributes = None if enabled is None else self._enabled_attributes[bool(enabled)]
 
         parameters = self._models.CertificateCreateParameters(
-            certificate_policy=policy._to_certificate_policy_bundle(),
+            certificate_policy=policy._get_cached_policy_bundle(),
             certificate_attributes=attributes,
             tags=kwargs.pop("tags", None),
         )
 
+        self._invalidate_cached(certificate_name)
         pipeline_response, cert_bundle = await self._client.create_certificate(
             vault_base_url=self.vault_url,
             certificate_name=certificate_name,
             parameters=parameters,
-            cls=lambda pipeline_response, deserialized, _: (pipeline_response, deserialized),
+            cls=_response_and_deserialized,
             **kwargs
         )
 
         create_certificate_operation = CertificateOperation._from_certificate_operation_bundle(cert_bundle)
 
-        command = partial(self.get_certificate_operation, certificate_name=certificate_name, **kwargs)
+        async def command() -> CertificateOperation:
+            return await self.get_certificate_operation(certificate_name=certificate_name, **kwargs)
 
-        get_certificate_command = partial(self.get_certificate, certificate_name=certificate_name, **kwargs)
+        async def get_certificate_command() -> KeyVaultCertificate:
+            return await self.get_certificate(certificate_name=certificate_name, **kwargs)
 
         create_certificate_polling = CreateCertificatePollerAsync(
             pipeline_response=pipeline_response,
             get_certificate_command=get_certificate_command,
             interval=polling_interval,
         )
-        def no_op(*_, **__) -> Any:  # The deserialization callback is ignored based on polling implementation
-            pass
-        return await AsyncLROPoller(command, create_certificate_operation, no_op, create_certificate_polling)
+        return await AsyncLROPoller(command, create_certificate_operation, _no_op, create_certificate_polling)
 
     @distributed_trace_async
     async def get_certificate(self, certificate_name: str, **kwargs: Any) -> KeyVaultCertificate:
@@ -152,12 +347,7 @@ class CertificateClient(AsyncKeyVaultClientBase):
                 :caption: Get a certificate
                 :dedent: 8
         """
-        bundle = await self._client.get_certificate(
-            vault_base_url=self.vault_url,
-            certificate_name=certificate_name,
-            certificate_version="",
-            **kwargs
-        )
+        bundle = await self._get_certificate_bundle(certificate_name, "", **kwargs)
         return KeyVaultCertificate._from_certificate_bundle(certificate_bundle=bundle)
 
     @distributed_trace_async
@@ -186,12 +376,7 @@ class CertificateClient(AsyncKeyVaultClientBase):
                 :caption: Get a certificate with a specific version
                 :dedent: 8
         """
-        bundle = await self._client.get_certificate(
-            vault_base_url=self.vault_url,
-            certificate_name=certificate_name,
-            certificate_version=version,
-            **kwargs
-        )
+        bundle = await self._get_certificate_bundle(certificate_name, version, **kwargs)
         return KeyVaultCertificate._from_certificate_bundle(certificate_bundle=bundle)
 
     @distributed_trace_async
@@ -216,22 +401,24 @@ class CertificateClient(AsyncKeyVaultClientBase):
                 :caption: Delete a certificate
                 :dedent: 8
         """
-        polling_interval = kwargs.pop("_polling_interval", None)
-        if polling_interval is None:
-            polling_interval = 2
+        polling_interval = _pop_polling_interval(kwargs, 2, jitter=0.5)
+        self._invalidate_cached(certificate_name)
         pipeline_response, deleted_cert_bundle = await self._client.delete_certificate(
             vault_base_url=self.vault_url,
             certificate_name=certificate_name,
-            cls=lambda pipeline_response, deserialized, _: (pipeline_response, deserialized),
+            cls=_response_and_deserialized,
             **kwargs,
         )
         deleted_certificate = DeletedCertificate._from_deleted_certificate_bundle(deleted_cert_bundle)
 
+        async def command() -> DeletedCertificate:
+            return await self.get_deleted_certificate(certificate_name=certificate_name, **kwargs)
+
         polling_method = AsyncDeleteRecoverPollingMethod(
             # no recovery ID means soft-delete is disabled, in which case we initialize the poller as finished
             finished=deleted_certificate.recovery_id is None,
             pipeline_response=pipeline_response,
-            command=partial(self.get_deleted_certificate, certificate_name=certificate_name, **kwargs),
+            command=command,
             final_resource=deleted_certificate,
             interval=polling_interval,
         )
@@ -311,18 +498,19 @@ class CertificateClient(AsyncKeyVaultClientBase):
                 :caption: Recover a deleted certificate
                 :dedent: 8
         """
-        polling_interval = kwargs.pop("_polling_interval", None)
-        if polling_interval is None:
-            polling_interval = 2
+        polling_interval = _pop_polling_interval(kwargs, 2, jitter=0.5)
+        self._invalidate_cached(certificate_name)
         pipeline_response, recovered_cert_bundle = await self._client.recover_deleted_certificate(
             vault_base_url=self.vault_url,
             certificate_name=certificate_name,
-            cls=lambda pipeline_response, deserialized, _: (pipeline_response, deserialized),
+            cls=_response_and_deserialized,
             **kwargs,
         )
         recovered_certificate = KeyVaultCertificate._from_certificate_bundle(recovered_cert_bundle)
 
-        command = partial(self.get_certificate, certificate_name=certificate_name, **kwargs)
+        async def command() -> KeyVaultCertificate:
+            return await self.get_certificate(certificate_name=certificate_name, **kwargs)
+
         polling_method = AsyncDeleteRecoverPollingMethod(
             pipeline_response=pipeline_response,
             command=command,
@@ -369,20 +557,18 @@ class CertificateClient(AsyncKeyVaultClientBase):
         enabled = kwargs.pop("enabled", None)
         policy = kwargs.pop("policy", None)
 
-        if enabled is not None:
-            attributes = self._models.CertificateAttributes(enabled=enabled)
-        else:
-            attributes = None
-        base64_encoded_certificate = base64.b64encode(certificate_bytes).decode("utf-8")
+        attributes = None if enabled is None else self._enabled_attributes[bool(enabled)]
+        base64_encoded_certificate = await _encode_certificate(certificate_bytes)
 
         parameters = self._models.CertificateImportParameters(
             base64_encoded_certificate=base64_encoded_certificate,
             password=kwargs.pop("password", None),
-            certificate_policy=policy._to_certificate_policy_bundle() if policy else None,
+            certificate_policy=policy._get_cached_policy_bundle() if policy else None,
             certificate_attributes=attributes,
             tags=kwargs.pop("tags", None),
         )
 
+        self._invalidate_cached(certificate_name)
         bundle = await self._client.import_certificate(
             vault_base_url=self.vault_url,
             certificate_name=certificate_name,
@@ -404,9 +590,16 @@ class CertificateClient(AsyncKeyVaultClientBase):
 
         :raises ~azure.core.exceptions.HttpResponseError:
         """
+        if self._policy_cache_ttl:
+            cached = self._policy_cache.get(certificate_name.lower())
+            if cached and time.monotonic() - cached[0] < self._policy_cache_ttl:
+                return CertificatePolicy._from_certificate_policy_bundle(certificate_policy_bundle=cached[1])
+
         bundle = await self._client.get_certificate_policy(
             vault_base_url=self.vault_url, certificate_name=certificate_name, **kwargs
         )
+        if self._policy_cache_ttl:
+            self._policy_cache[certificate_name.lower()] = (time.monotonic(), bundle)
         return CertificatePolicy._from_certificate_policy_bundle(certificate_policy_bundle=bundle)
 
     @distributed_trace_async
@@ -426,10 +619,11 @@ class CertificateClient(AsyncKeyVaultClientBase):
 
         :raises ~azure.core.exceptions.HttpResponseError:
         """
+        self._invalidate_cached(certificate_name)
         bundle = await self._client.update_certificate_policy(
             vault_base_url=self.vault_url,
             certificate_name=certificate_name,
-            certificate_policy=policy._to_certificate_policy_bundle(),
+            certificate_policy=policy._get_cached_policy_bundle(),
             **kwargs
         )
         return CertificatePolicy._from_certificate_policy_bundle(certificate_policy_bundle=bundle)
@@ -463,15 +657,13 @@ class CertificateClient(AsyncKeyVaultClientBase):
 
         enabled = kwargs.pop("enabled", None)
 
-        if enabled is not None:
-            attributes = self._models.CertificateAttributes(enabled=enabled)
-        else:
-            attributes = None
+        attributes = None if enabled is None else self._enabled_attributes[bool(enabled)]
 
         parameters = self._models.CertificateUpdateParameters(
             certificate_attributes=attributes, tags=kwargs.pop("tags", None)
         )
 
+        self._invalidate_cached(certificate_name)
         bundle = await self._client.update_certificate(
             vault_base_url=self.vault_url,
             certificate_name=certificate_name,
@@ -539,7 +731,10 @@ class CertificateClient(AsyncKeyVaultClientBase):
             parameters=self._models.CertificateRestoreParameters(certificate_bundle_backup=backup),
             **kwargs
         )
-        return KeyVaultCertificate._from_certificate_bundle(certificate_bundle=bundle)
+        certificate = KeyVaultCertificate._from_certificate_bundle(certificate_bundle=bundle)
+        if certificate.name:
+            self._invalidate_cached(certificate.name)
+        return certificate
 
     @distributed_trace
     def list_deleted_certificates(
@@ -581,7 +776,7 @@ class CertificateClient(AsyncKeyVaultClientBase):
         return self._client.get_deleted_certificates(
             vault_base_url=self._vault_url,
             maxresults=max_page_size,
-            cls=lambda objs: [DeletedCertificate._from_deleted_certificate_item(x) for x in objs],
+            cls=_deleted_certificates_from_items,
             **kwargs
         )
 
@@ -624,7 +819,7 @@ class CertificateClient(AsyncKeyVaultClientBase):
         return self._client.get_certificates(
             vault_base_url=self._vault_url,
             maxresults=max_page_size,
-            cls=lambda objs: [CertificateProperties._from_certificate_item(x) for x in objs],
+            cls=_certificate_properties_from_items,
             **kwargs
         )
 
@@ -656,7 +851,7 @@ class CertificateClient(AsyncKeyVaultClientBase):
             vault_base_url=self._vault_url,
             certificate_name=certificate_name,
             maxresults=max_page_size,
-            cls=lambda objs: [CertificateProperties._from_certificate_item(x) for x in objs],
+            cls=_certificate_properties_from_items,
             **kwargs
         )
 
@@ -784,7 +979,7 @@ class CertificateClient(AsyncKeyVaultClientBase):
         bundle = await self._client.update_certificate_operation(
             vault_base_url=self.vault_url,
             certificate_name=certificate_name,
-            certificate_operation=self._models.CertificateOperationUpdateParameter(cancellation_requested=True),
+            certificate_operation=self._cancel_operation_parameter,
             **kwargs
         )
         return CertificateOperation._from_certificate_operation_bundle(certificate_operation_bundle=bundle)
@@ -816,15 +1011,13 @@ class CertificateClient(AsyncKeyVaultClientBase):
 
         enabled = kwargs.pop("enabled", None)
 
-        if enabled is not None:
-            attributes = self._models.CertificateAttributes(enabled=enabled)
-        else:
-            attributes = None
+        attributes = None if enabled is None else self._enabled_attributes[bool(enabled)]
 
         parameters = self._models.CertificateMergeParameters(
             x509_certificates=x509_certificates, certificate_attributes=attributes, tags=kwargs.pop("tags", None)
         )
 
+        self._invalidate_cached(certificate_name)
         bundle = await self._client.merge_certificate(
             vault_base_url=self.vault_url,
             certificate_name=certificate_name,
@@ -898,8 +1091,9 @@ class CertificateClient(AsyncKeyVaultClientBase):
         else:
             issuer_credentials = None
         if admin_contacts:
+            administrator_details = self._models.AdministratorDetails
             admin_details: Optional[List[Any]] = [
-                self._models.AdministratorDetails(
+                administrator_details(
                     first_name=contact.first_name,
                     last_name=contact.last_name,
                     email_address=contact.email,
@@ -962,15 +1156,16 @@ class CertificateClient(AsyncKeyVaultClientBase):
         else:
             issuer_credentials = None
         if admin_contacts:
-            admin_details: Optional[List[Any]] = list(
-                self._models.AdministratorDetails(
+            administrator_details = self._models.AdministratorDetails
+            admin_details: Optional[List[Any]] = [
+                administrator_details(
                     first_name=contact.first_name,
                     last_name=contact.last_name,
                     email_address=contact.email,
                     phone=contact.phone,
                 )
                 for contact in admin_contacts
-            )
+            ]
         else:
             admin_details = None
         if organization_id or admin_details:
@@ -1020,6 +1215,47 @@ class CertificateClient(AsyncKeyVaultClientBase):
         )
         return CertificateIssuer._from_issuer_bundle(issuer_bundle=issuer_bundle)
 
+    @distributed_trace_async
+    async def get_issuers(self, issuer_names: Iterable[str], **kwargs: Any) -> List[CertificateIssuer]:
+        """Gets several certificate issuers, sending the requests concurrently.
+
+        Requires certificates/manageissuers/getissuers permission.
+
+        :param issuer_names: The names of the issuers.
+        :type issuer_names: Iterable[str]
+
+        :keyword int max_concurrency: How many requests may be in flight at once. Defaults to 16.
+
+        :return: The issuers, in the order of ``issuer_names``.
+        :rtype: list[~azure.keyvault.certificates.CertificateIssuer]
+
+        :raises ~azure.core.exceptions.ResourceNotFoundError or ~azure.core.exceptions.HttpResponseError:
+            the former if an issuer doesn't exist; the latter for other errors. After an error no further requests are
+            sent, and the first error is raised once the requests already sent have completed.
+        """
+        max_concurrency = kwargs.pop("max_concurrency", _BULK_MAX_CONCURRENCY)
+        return await _gather_bounded((self.get_issuer(name, **kwargs) for name in issuer_names), max_concurrency)
+
+    @distributed_trace_async
+    async def delete_issuers(self, issuer_names: Iterable[str], **kwargs: Any) -> List[CertificateIssuer]:
+        """Deletes several certificate issuers, sending the requests concurrently.
+
+        Requires certificates/manageissuers/deleteissuers permission.
+
+        :param issuer_names: The names of the issuers.
+        :type issuer_names: Iterable[str]
+
+        :keyword int max_concurrency: How many requests may be in flight at once. Defaults to 16.
+
+        :return: The deleted issuers, in the order of ``issuer_names``.
+        :rtype: list[~azure.keyvault.certificates.CertificateIssuer]
+
+        :raises ~azure.core.exceptions.HttpResponseError: After an error no further issuers are deleted, and the first
+            error is raised once the requests already sent have completed. Issuers deleted before then stay deleted.
+        """
+        max_concurrency = kwargs.pop("max_concurrency", _BULK_MAX_CONCURRENCY)
+        return await _gather_bounded((self.delete_issuer(name, **kwargs) for name in issuer_names), max_concurrency)
+
     @distributed_trace
     def list_properties_of_issuers(self, **kwargs: Any) -> AsyncItemPaged[IssuerProperties]:
         """Lists properties of the certificate issuers for the key vault.
@@ -1043,7 +1279,7 @@ class CertificateClient(AsyncKeyVaultClientBase):
         return self._client.get_certificate_issuers(
             vault_base_url=self.vault_url,
             maxresults=max_page_size,
-            cls=lambda objs: [IssuerProperties._from_issuer_item(x) for x in objs],
+            cls=_issuer_properties_from_items,
             **kwargs
         )
 
@@ -0,0 +1,37 @@
+# ------------------------------------
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+# ------------------------------------
+"""Policy bounding how many requests a client has in flight.
+
+Key Vault throttles each vault separately. A client that starts hundreds of operations at once gets most of them
+throttled and retried, so instead of failing, requests past the limit wait here until an earlier one completes.
+"""
+import asyncio
+from typing import Optional
+
+from azure.core.pipeline import PipelineRequest, PipelineResponse
+from azure.core.pipeline.policies import AsyncHTTPPolicy
+
+
+class AsyncConcurrencyLimitPolicy(AsyncHTTPPolicy):
+    """Policy letting at most a given number of requests through at once.
+
+    Place it ahead of the retry policy so that a request keeps its slot while it's retried.
+
+    :param int max_concurrent_requests: How many requests may be in flight at once.
+    """
+
+    def __init__(self, max_concurrent_requests: int) -> None:
+        super().__init__()
+        if max_concurrent_requests < 1:
+            raise ValueError("max_concurrent_requests must be at least 1")
+        self._max_concurrent_requests = max_concurrent_requests
+        # created on first send so that it belongs to the loop the client is used on
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def send(self, request: PipelineRequest) -> PipelineResponse:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrent_requests)
+        async with self._semaphore:
+            return await self.next.send(request)
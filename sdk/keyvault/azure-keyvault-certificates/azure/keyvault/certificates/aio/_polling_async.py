@@ -17,7 +17,7 @@ logger = logging.getLogger(__name__)
 
 class CreateCertificatePollerAsync(AsyncPollingMethod):
     def __init__(
-            self, pipeline_response: PipelineResponse, get_certificate_command: Callable, interval: int = 5
+            self, pipeline_response: PipelineResponse, get_certificate_command: Callable, interval: float = 5
         ) -> None:
         self._pipeline_response = pipeline_response
         self._command: Optional[Callable] = None
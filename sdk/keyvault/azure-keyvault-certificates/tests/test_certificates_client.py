@@ -5,6 +5,7 @@
 import functools
 import json
 import logging
+import pickle
 import time
 from unittest.mock import Mock, patch
 
@@ -780,3 +781,21 @@ def test_thumbprint_hex():
         x509_thumbprint=b"v\xe1\x81\x9f\xad\xf0jU\xefK\x12j.\xf7C\xc2\xba\xe8\xa1Q",
     )
     assert "76E1819FADF06A55EF4B126A2EF743C2BAE8A151" in str(properties)
+
+
+def test_listed_properties_pickle():
+    """Properties returned by list methods must survive a pickle round trip."""
+    properties = CertificateProperties(
+        cert_id="https://vaultname.vault.azure.net/certificates/certname/version", tags={"tag": "value"}
+    )
+    issuer = IssuerProperties(
+        issuer_id="https://vaultname.vault.azure.net/certificates/issuers/issuer", provider="Test"
+    )
+
+    properties_copy = pickle.loads(pickle.dumps(properties))
+    assert properties_copy.id == properties.id
+    assert properties_copy.version == "version"
+    assert properties_copy.tags == {"tag": "value"}
+    issuer_copy = pickle.loads(pickle.dumps(issuer))
+    assert issuer_copy.name == "issuer"
+    assert issuer_copy.provider == "Test"
@@ -6,7 +6,7 @@ import asyncio
 import functools
 import logging
 import json
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 from azure.core.exceptions import ResourceExistsError, ResourceNotFoundError
 from azure.core.pipeline.policies import SansIOHTTPPolicy
@@ -789,3 +789,129 @@ def test_custom_hook_policy():
 
     client = CertificateClient("...", object(), custom_hook_policy=CustomHookPolicy())
     assert isinstance(client._client._config.custom_hook_policy, CustomHookPolicy)
+
+
+@pytest.mark.asyncio
+async def test_policy_cache_ttl():
+    client = CertificateClient("https://localhost", object(), policy_cache_ttl=300)
+    bundle = CertificatePolicy.get_default()._to_certificate_policy_bundle()
+    get_policy = AsyncMock(return_value=bundle)
+    update_policy = AsyncMock(return_value=bundle)
+
+    with patch.object(client._client, "get_certificate_policy", get_policy):
+        with patch.object(client._client, "update_certificate_policy", update_policy):
+            policy = await client.get_certificate_policy("cert")
+            await client.get_certificate_policy("CERT")  # certificate names are case-insensitive
+            assert get_policy.call_count == 1
+
+            # writes through the client invalidate the cached policy
+            await client.update_certificate_policy("cert", policy)
+            await client.get_certificate_policy("cert")
+            assert get_policy.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cert_cache_ttl():
+    client = CertificateClient("https://localhost", object(), cert_cache_ttl=60)
+    bundle = Mock(id="https://localhost/certificates/cert/version", policy=None)
+    get_certificate = AsyncMock(return_value=bundle)
+
+    with patch.object(client._client, "get_certificate", get_certificate):
+        with patch.object(client._client, "update_certificate", AsyncMock(return_value=bundle)):
+            await client.get_certificate("cert")
+            await client.get_certificate("Cert")
+            await client.get_certificate_version("cert", "version")
+            await client.get_certificate_version("cert", "version")
+            assert get_certificate.call_count == 2
+
+            # writes through the client evict every cached version of the certificate
+            await client.update_certificate_properties("cert", enabled=False)
+            await client.get_certificate("cert")
+            await client.get_certificate_version("cert", "version")
+            assert get_certificate.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_concurrent_get_certificate_requests_coalesce():
+    client = CertificateClient("https://localhost", object())
+    bundle = Mock(id="https://localhost/certificates/cert/version", policy=None)
+    get_certificate = AsyncMock(return_value=bundle)
+
+    async def slow_get_certificate(**kwargs):
+        await asyncio.sleep(0.01)
+        return await get_certificate(**kwargs)
+
+    with patch.object(client._client, "get_certificate", slow_get_certificate):
+        certificates = await asyncio.gather(*[client.get_certificate_version("cert", "version") for _ in range(5)])
+        assert len(certificates) == 5
+        assert get_certificate.call_count == 1
+
+        # requests carrying options of their own are sent separately
+        await asyncio.gather(client.get_certificate("cert"), client.get_certificate("cert", headers={"foo": "bar"}))
+        assert get_certificate.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_cancelled_get_certificate_request_does_not_cancel_others():
+    client = CertificateClient("https://localhost", object())
+    bundle = Mock(id="https://localhost/certificates/cert/version", policy=None)
+    get_certificate = AsyncMock(return_value=bundle)
+
+    async def slow_get_certificate(**kwargs):
+        await asyncio.sleep(0.01)
+        return await get_certificate(**kwargs)
+
+    with patch.object(client._client, "get_certificate", slow_get_certificate):
+        first = asyncio.ensure_future(client.get_certificate_version("cert", "version"))
+        await asyncio.sleep(0)
+        others = asyncio.gather(*[client.get_certificate_version("cert", "version") for _ in range(2)])
+        await asyncio.sleep(0)
+        first.cancel()
+
+        certificates = await others
+        assert [certificate.id for certificate in certificates] == [bundle.id] * 2
+        assert first.cancelled()
+        assert get_certificate.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_bulk_issuer_operations():
+    client = CertificateClient("https://localhost", object())
+    in_flight = []
+    peak = 0
+
+    async def delete_certificate_issuer(issuer_name, **kwargs):
+        nonlocal peak
+        in_flight.append(issuer_name)
+        peak = max(peak, len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.remove(issuer_name)
+        return Mock(id="https://localhost/certificates/issuers/" + issuer_name, organization_details=None)
+
+    names = ["issuer{}".format(i) for i in range(5)]
+    with patch.object(client._client, "delete_certificate_issuer", delete_certificate_issuer):
+        issuers = await client.delete_issuers(names, max_concurrency=2)
+    assert [issuer.name for issuer in issuers] == names
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_bulk_issuer_operations_stop_after_error():
+    client = CertificateClient("https://localhost", object())
+    deleted = []
+
+    async def delete_certificate_issuer(issuer_name, **kwargs):
+        if issuer_name == "issuer1":
+            raise ResourceNotFoundError("issuer1")
+        await asyncio.sleep(0.01)
+        deleted.append(issuer_name)
+        return Mock(id="https://localhost/certificates/issuers/" + issuer_name, organization_details=None)
+
+    names = ["issuer{}".format(i) for i in range(5)]
+    with patch.object(client._client, "delete_certificate_issuer", delete_certificate_issuer):
+        with pytest.raises(ResourceNotFoundError):
+            await client.delete_issuers(names, max_concurrency=2)
+        # the request already sent completes before the error is raised, and no further requests are sent
+        assert deleted == ["issuer0"]
+        await asyncio.sleep(0.05)
+        assert deleted == ["issuer0"]
@@ -2,6 +2,11 @@
 # Copyright (c) Microsoft Corporation.
 # Licensed under the MIT License.
 # ------------------------------------
+import asyncio
+from unittest import mock
+
+from azure.core.pipeline import AsyncPipeline
+from azure.core.rest import HttpRequest
 from azure.keyvault.certificates.aio import CertificateClient
 import pytest
 
@@ -27,3 +32,54 @@ async def test_context_manager():
         assert transport.__aenter__.call_count == 1
     assert transport.__aenter__.call_count == 1
     assert transport.__aexit__.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_shared_transport():
+    transport = AsyncMockTransport()
+    clients = [
+        CertificateClient(vault_url="https://localhost", credential=object(), transport=transport, session_owner=False)
+        for _ in range(2)
+    ]
+
+    async with clients[0]:
+        pass
+    await clients[1].close()
+    assert transport.__aenter__.call_count == 0
+    assert transport.__aexit__.call_count == 0
+
+
+@pytest.mark.asyncio
+async def test_caller_owned_session():
+    """session_owner=False without a transport should reach the default transport, leaving the session open"""
+    aiohttp = pytest.importorskip("aiohttp")
+    async with aiohttp.ClientSession() as session:
+        client = CertificateClient(
+            vault_url="https://localhost", credential=object(), session=session, session_owner=False
+        )
+        async with client:
+            pass
+        assert not session.closed
+
+
+@pytest.mark.asyncio
+async def test_max_concurrent_requests():
+    in_flight = []
+    peak = 0
+
+    async def send(request, **_):
+        nonlocal peak
+        in_flight.append(request)
+        peak = max(peak, len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.remove(request)
+        return mock.Mock(status_code=200)
+
+    transport = AsyncMockTransport(send=send)
+    client = CertificateClient(
+        vault_url="https://localhost", credential=object(), transport=transport, max_concurrent_requests=2
+    )
+    # the limit applies to every call, ahead of the challenge authentication policy
+    pipeline = AsyncPipeline(transport, policies=[client._client._client._pipeline._impl_policies[0]])
+    await asyncio.gather(*(pipeline.run(HttpRequest("GET", "https://localhost")) for _ in range(5)))
+    assert peak == 2
@@ -2,7 +2,9 @@
 # Copyright (c) Microsoft Corporation.
 # Licensed under the MIT License.
 # ------------------------------------
-from typing import Any, cast, Optional, NoReturn, Union, TYPE_CHECKING
+import hashlib
+from operator import attrgetter
+from typing import Any, cast, Optional, NoReturn, Tuple, Union, TYPE_CHECKING
 
 from cryptography.exceptions import InvalidSignature
 from cryptography.hazmat.primitives.asymmetric.padding import AsymmetricPadding, OAEP, PKCS1v15, PSS, MGF1
@@ -44,6 +46,41 @@ PSS_MAP = {
     SignatureAlgorithm.rs384: SignatureAlgorithm.ps384,
     SignatureAlgorithm.rs512: SignatureAlgorithm.ps512,
 }
+# hashlib digests one-shot data without creating a cryptography Hash context
+HASHLIB_MAP = {SHA256: hashlib.sha256, SHA384: hashlib.sha384, SHA512: hashlib.sha512}
+
+
+_JWK_FIELDS = attrgetter(*JsonWebKey._FIELDS)  # pylint:disable=protected-access
+
+
+def _digest(data: Union[bytes, bytearray, memoryview], algorithm: HashAlgorithm) -> bytes:
+    # Both hashlib and Hash read any bytes-like object through the buffer protocol, so data is never copied
+    hash_function = HASHLIB_MAP.get(type(algorithm))
+    if hash_function is not None:
+        return hash_function(data).digest()
+    digest = Hash(algorithm)
+    digest.update(data)
+    return digest.finalize()
+
+
+def _get_signature_digest(
+    data: Union[bytes, bytearray, memoryview], padding: AsymmetricPadding, algorithm: Union[Prehashed, HashAlgorithm]
+) -> Tuple[SignatureAlgorithm, bytes]:
+    # With Prehashed, the caller has already hashed the message and data is the digest
+    if isinstance(algorithm, Prehashed):
+        if len(data) != algorithm.digest_size:
+            raise ValueError("The provided data must be the same length as the hash algorithm's digest size.")
+        hash_algorithm = algorithm._algorithm  # pylint:disable=protected-access
+        return get_signature_algorithm(padding, hash_algorithm), bytes(data)
+    return get_signature_algorithm(padding, algorithm), _digest(data, algorithm)
+
+
+# Public algorithm and mgf properties were only added in https://github.com/pyca/cryptography/pull/9582
+# The private attributes have been available in every version, so we use them with older versions. Which ones exist
+# depends only on the installed cryptography version, so it's checked once here.
+_OAEP_ALGORITHM_ATTRIBUTE = "algorithm" if hasattr(OAEP, "algorithm") else "_algorithm"
+_OAEP_MGF_ATTRIBUTE = "mgf" if hasattr(OAEP, "mgf") else "_mgf"
+_PSS_MGF_ATTRIBUTE = "mgf" if hasattr(PSS, "mgf") else "_mgf"
 
 
 def get_encryption_algorithm(padding: AsymmetricPadding) -> EncryptionAlgorithm:
@@ -56,21 +93,13 @@ def get_encryption_algorithm(padding: AsymmetricPadding) -> EncryptionAlgorithm:
     :rtype: EncryptionAlgorithm
     """
     if isinstance(padding, OAEP):
-        # Public algorithm property was only added in https://github.com/pyca/cryptography/pull/9582
-        # _algorithm property has been available in every version of the OAEP class, so we use it as a backup
-        try:
-            algorithm = padding.algorithm  # type: ignore[attr-defined]
-        except AttributeError:
-            algorithm = padding._algorithm  # pylint:disable=protected-access
-        mapped_algorithm = OAEP_MAP.get(type(algorithm))
-        if mapped_algorithm is None:
-            raise ValueError(f"Unsupported algorithm: {algorithm.name}")
-
-        # Public mgf property was added at the same time as algorithm
+        algorithm = getattr(padding, _OAEP_ALGORITHM_ATTRIBUTE)
         try:
-            mgf = padding.mgf  # type: ignore[attr-defined]
-        except AttributeError:
-            mgf = padding._mgf  # pylint:disable=protected-access
+            mapped_algorithm = OAEP_MAP[type(algorithm)]
+        except KeyError:
+            raise ValueError(f"Unsupported algorithm: {algorithm.name}") from None
+
+        mgf = getattr(padding, _OAEP_MGF_ATTRIBUTE)
         if not isinstance(mgf, MGF1):
             raise ValueError(f"Unsupported MGF: {mgf}")
 
@@ -93,20 +122,15 @@ def get_signature_algorithm(padding: AsymmetricPadding, algorithm: HashAlgorithm
     :returns: The corresponding Key Vault signature algorithm.
     :rtype: SignatureAlgorithm
     """
-    mapped_algorithm = SIGN_ALGORITHM_MAP.get(type(algorithm))
-    if mapped_algorithm is None:
-        raise ValueError(f"Unsupported algorithm: {algorithm.name}")
+    try:
+        mapped_algorithm = SIGN_ALGORITHM_MAP[type(algorithm)]
+    except KeyError:
+        raise ValueError(f"Unsupported algorithm: {algorithm.name}") from None
 
     # If PSS padding is requested, use the PSS equivalent algorithm
     if isinstance(padding, PSS):
-        mapped_algorithm = PSS_MAP.get(mapped_algorithm)
-
-        # Public mgf property was only added in https://github.com/pyca/cryptography/pull/9582
-        # _mgf property has been available in every version of the PSS class, so we use it as a backup
-        try:
-            mgf = padding.mgf  # type: ignore[attr-defined]
-        except AttributeError:
-            mgf = padding._mgf  # pylint:disable=protected-access
+        mapped_algorithm = PSS_MAP[mapped_algorithm]
+        mgf = getattr(padding, _PSS_MGF_ATTRIBUTE)
         if not isinstance(mgf, MGF1):
             raise ValueError(f"Unsupported MGF: {mgf}")
 
@@ -128,6 +152,9 @@ class KeyVaultRSAPublicKey(RSAPublicKey):
     def __init__(self, client: "CryptographyClient", key_material: Optional[JsonWebKey] = None) -> None:
         self._client: "CryptographyClient" = client
         self._key: Optional[JsonWebKey] = key_material
+        # built from the key material on first use; the key material doesn't change afterward
+        self._public_numbers: Optional[RSAPublicNumbers] = None
+        self._public_key: Optional[RSAPublicKey] = None
 
     def encrypt(self, plaintext: bytes, padding: AsymmetricPadding) -> bytes:
         """Encrypts the given plaintext.
@@ -160,8 +187,7 @@ class KeyVaultRSAPublicKey(RSAPublicKey):
                 "(encrypt, verify) can be performed."
             )
 
-        public_key = self.public_numbers().public_key()
-        return public_key.key_size
+        return self._get_public_key().key_size
 
     def public_numbers(self) -> RSAPublicNumbers:
         """Returns an `RSAPublicNumbers` representing the key's public numbers.
@@ -177,9 +203,17 @@ class KeyVaultRSAPublicKey(RSAPublicKey):
                 "(encrypt, verify) can be performed."
             )
 
-        e = int.from_bytes(self._key.e, "big")  # type: ignore[attr-defined]
-        n = int.from_bytes(self._key.n, "big")  # type: ignore[attr-defined]
-        return RSAPublicNumbers(e, n)
+        if self._public_numbers is None:
+            e = int.from_bytes(self._key.e, "big")  # type: ignore[attr-defined]
+            n = int.from_bytes(self._key.n, "big")  # type: ignore[attr-defined]
+            self._public_numbers = RSAPublicNumbers(e, n)
+        return self._public_numbers
+
+    def _get_public_key(self) -> RSAPublicKey:
+        # Building the key makes OpenSSL load and check it, so it's done once rather than on every call
+        if self._public_key is None:
+            self._public_key = self.public_numbers().public_key()
+        return self._public_key
 
     def public_bytes(self, encoding: Encoding, format: PublicFormat) -> bytes:
         """Allows serialization of the key to bytes.
@@ -204,8 +238,7 @@ class KeyVaultRSAPublicKey(RSAPublicKey):
                 "(encrypt, verify) can be performed."
             )
 
-        public_key = self.public_numbers().public_key()
-        return public_key.public_bytes(encoding=encoding, format=format)
+        return self._get_public_key().public_bytes(encoding=encoding, format=format)
 
     def verify(
         self,
@@ -217,26 +250,25 @@ class KeyVaultRSAPublicKey(RSAPublicKey):
         """Verifies the signature of the data.
 
         :param bytes signature: The signature to sign, as bytes.
-        :param bytes data: The message string that was signed., as bytes.
+        :param bytes data: The message string that was signed, as bytes. Any bytes-like object is accepted, so a
+            `memoryview` over a large buffer (such as a memory-mapped file) is hashed without being copied.
         :param padding: The padding to use. Supported paddings are `PKCS1v15` and `PSS`. For `PSS`, the only supported
             mask generation function is `MGF1`. See https://learn.microsoft.com/azure/key-vault/keys/about-keys-details
             for details.
         :type padding: ~cryptography.hazmat.primitives.asymmetric.padding.AsymmetricPadding
-        :param algorithm: The algorithm to sign with. Only `HashAlgorithm`s are supported -- specifically, `SHA256`,
-            `SHA384`, and `SHA512`.
+        :param algorithm: The algorithm to sign with. Supported hash algorithms are `SHA256`, `SHA384`, and `SHA512`.
+            Wrap the hash algorithm in `Prehashed` to pass the digest of the message as `data` instead of the message
+            itself, which skips hashing it again.
         :type algorithm: ~cryptography.hazmat.primitives.asymmetric.utils.Prehashed or
             cryptography.hazmat.primitives.hashes.HashAlgorithm
 
         :raises InvalidSignature: If the signature does not validate.
         """
-        if isinstance(algorithm, Prehashed):
-            raise ValueError("`Prehashed` algorithms are unsupported. Please provide a `HashAlgorithm` instead.")
-        mapped_algorithm = get_signature_algorithm(padding, algorithm)
-        digest = Hash(algorithm)
-        digest.update(data)
-        result = self._client.verify(mapped_algorithm, digest.finalize(), signature)
+        mapped_algorithm, digest = _get_signature_digest(data, padding, algorithm)
+        result = self._client.verify(mapped_algorithm, digest, signature)
         if not result.is_valid:
-            raise InvalidSignature(f"The provided signature '{signature!r}' is invalid.")
+            # A full repr of a 256+ byte signature is mostly noise; the leading bytes are enough to tell it apart
+            raise InvalidSignature(f"The provided signature (starting {signature[:16].hex()}) is invalid.")
 
     def recover_data_from_signature(
         self, signature: bytes, padding: AsymmetricPadding, algorithm: Optional[HashAlgorithm]
@@ -281,7 +313,7 @@ class KeyVaultRSAPublicKey(RSAPublicKey):
                 "(encrypt, verify) can be performed."
             )
 
-        public_key = self.public_numbers().public_key()
+        public_key = self._get_public_key()
         try:
             return public_key.recover_data_from_signature(signature=signature, padding=padding, algorithm=algorithm)
         except AttributeError as exc:
@@ -303,10 +335,25 @@ class KeyVaultRSAPublicKey(RSAPublicKey):
             return False
 
         if isinstance(other, KeyVaultRSAPublicKey):
-            return all(getattr(self._key, field) == getattr(other._key, field) for field in self._key._FIELDS)
-        if isinstance(other, JsonWebKey):
-            return all(getattr(self._key, field) == getattr(other, field) for field in self._key._FIELDS)
-        return False
+            other_key = other._key
+        elif isinstance(other, JsonWebKey):
+            other_key = other
+        else:
+            return False
+        if other_key is None:
+            return False
+        # Tuples compare element by element, stopping at the first difference
+        return _JWK_FIELDS(self._key) == _JWK_FIELDS(other_key)
+
+    def __hash__(self) -> int:
+        """Hashes the key by its public modulus and exponent, consistently with `__eq__`.
+
+        :returns: The hash of the key.
+        :rtype: int
+        """
+        if self._key is None:
+            return id(self)
+        return hash((self._key.n, self._key.e))  # type: ignore[attr-defined]
 
     def verifier(  # pylint:disable=docstring-missing-param,docstring-missing-return,docstring-missing-rtype
         self, signature: bytes, padding: AsymmetricPadding, algorithm: HashAlgorithm
@@ -326,6 +373,10 @@ class KeyVaultRSAPrivateKey(RSAPrivateKey):
     def __init__(self, client: "CryptographyClient", key_material: Optional[JsonWebKey]) -> None:
         self._client: "CryptographyClient" = client
         self._key: Optional[JsonWebKey] = key_material
+        self._public_key: Optional[KeyVaultRSAPublicKey] = None
+        # recovering missing prime factors is expensive, so the private numbers and key are only built once
+        self._private_numbers: Optional[RSAPrivateNumbers] = None
+        self._private_key: Optional[RSAPrivateKey] = None
 
     def decrypt(self, ciphertext: bytes, padding: AsymmetricPadding) -> bytes:
         """Decrypts the provided ciphertext.
@@ -370,7 +421,9 @@ class KeyVaultRSAPrivateKey(RSAPrivateKey):
         :returns: The `KeyVaultRSAPublicKey` associated with the key.
         :rtype: ~azure.keyvault.keys.crypto.KeyVaultRSAPublicKey
         """
-        return KeyVaultRSAPublicKey(self._client, self._key)
+        if self._public_key is None:
+            self._public_key = KeyVaultRSAPublicKey(self._client, self._key)
+        return self._public_key
 
     def sign(
         self,
@@ -380,25 +433,23 @@ class KeyVaultRSAPrivateKey(RSAPrivateKey):
     ) -> bytes:
         """Signs the data.
 
-        :param bytes data: The data to sign, as bytes.
+        :param bytes data: The data to sign, as bytes. Any bytes-like object is accepted, so a `memoryview` over a
+            large buffer (such as a memory-mapped file) is hashed without being copied.
         :param padding: The padding to use. Supported paddings are `PKCS1v15` and `PSS`. For `PSS`, the only supported
             mask generation function is `MGF1`. See https://learn.microsoft.com/azure/key-vault/keys/about-keys-details
             for details.
         :type padding: ~cryptography.hazmat.primitives.asymmetric.padding.AsymmetricPadding
-        :param algorithm: The algorithm to sign with. Only `HashAlgorithm`s are supported -- specifically, `SHA256`,
-            `SHA384`, and `SHA512`.
+        :param algorithm: The algorithm to sign with. Supported hash algorithms are `SHA256`, `SHA384`, and `SHA512`.
+            Wrap the hash algorithm in `Prehashed` to pass the digest of the message as `data` instead of the message
+            itself, which skips hashing it again.
         :type algorithm: ~cryptography.hazmat.primitives.asymmetric.utils.Prehashed or
             cryptography.hazmat.primitives.hashes.HashAlgorithm
 
         :returns: The signature, as bytes.
         :rtype: bytes
         """
-        if isinstance(algorithm, Prehashed):
-            raise ValueError("`Prehashed` algorithms are unsupported. Please provide a `HashAlgorithm` instead.")
-        mapped_algorithm = get_signature_algorithm(padding, algorithm)
-        digest = Hash(algorithm)
-        digest.update(data)
-        result = self._client.sign(mapped_algorithm, digest.finalize())
+        mapped_algorithm, digest = _get_signature_digest(data, padding, algorithm)
+        result = self._client.sign(mapped_algorithm, digest)
         return result.signature
 
     def private_numbers(self) -> RSAPrivateNumbers:
@@ -414,11 +465,12 @@ class KeyVaultRSAPrivateKey(RSAPrivateKey):
                 "Key material could not be obtained from Key Vault. Only remote cryptographic operations "
                 "(decrypt, sign) can be performed."
             )
+        if self._private_numbers is not None:
+            return self._private_numbers
 
-        # Fetch public numbers from JWK
-        e = int.from_bytes(self._key.e, "big")  # type: ignore[attr-defined]
-        n = int.from_bytes(self._key.n, "big")  # type: ignore[attr-defined]
-        public_numbers = RSAPublicNumbers(e, n)
+        # Public numbers are shared with the public key, which converts them from the JWK once
+        public_numbers = self.public_key().public_numbers()
+        e, n = public_numbers.e, public_numbers.n
 
         # Fetch private numbers from JWK
         p = int.from_bytes(self._key.p, "big") if self._key.p else None  # type: ignore[attr-defined]
@@ -440,7 +492,8 @@ class KeyVaultRSAPrivateKey(RSAPrivateKey):
         if iqmp is None:
             iqmp = rsa_crt_iqmp(p, q)
 
-        return RSAPrivateNumbers(p, q, d, dmp1, dmq1, iqmp, public_numbers)
+        self._private_numbers = RSAPrivateNumbers(p, q, d, dmp1, dmq1, iqmp, public_numbers)
+        return self._private_numbers
 
     def private_bytes(
         self, encoding: Encoding, format: PrivateFormat, encryption_algorithm: KeySerializationEncryption
@@ -469,12 +522,15 @@ class KeyVaultRSAPrivateKey(RSAPrivateKey):
                 "(decrypt, sign) can be performed."
             )
 
-        try:
-            private_numbers = self.private_numbers()
-        except ValueError as exc:
-            raise ValueError("Insufficient key material to serialize the private key.") from exc
-        private_key = private_numbers.private_key()
-        return private_key.private_bytes(encoding=encoding, format=format, encryption_algorithm=encryption_algorithm)
+        if self._private_key is None:
+            try:
+                private_numbers = self.private_numbers()
+            except ValueError as exc:
+                raise ValueError("Insufficient key material to serialize the private key.") from exc
+            self._private_key = private_numbers.private_key()
+        return self._private_key.private_bytes(
+            encoding=encoding, format=format, encryption_algorithm=encryption_algorithm
+        )
 
     def signer(  # pylint:disable=docstring-missing-param,docstring-missing-return,docstring-missing-rtype
         self, padding: AsymmetricPadding, algorithm: HashAlgorithm
@@ -492,6 +548,9 @@ class DecryptResult:
     :param bytes plaintext: The decrypted bytes
     """
 
+    # a result is created for every operation, so results don't carry a __dict__
+    __slots__ = ("key_id", "algorithm", "plaintext")
+
     def __init__(self, key_id: Optional[str], algorithm: EncryptionAlgorithm, plaintext: bytes) -> None:
         self.key_id = key_id
         self.algorithm = algorithm
@@ -513,6 +572,8 @@ class EncryptResult:
         authenticated algorithm
     """
 
+    __slots__ = ("key_id", "algorithm", "ciphertext", "iv", "tag", "aad")
+
     def __init__(self, key_id: Optional[str], algorithm: EncryptionAlgorithm, ciphertext: bytes, **kwargs: Any) -> None:
         self.key_id = key_id
         self.algorithm = algorithm
@@ -531,6 +592,8 @@ class SignResult:
     :param bytes signature:
     """
 
+    __slots__ = ("key_id", "algorithm", "signature")
+
     def __init__(self, key_id: Optional[str], algorithm: SignatureAlgorithm, signature: bytes) -> None:
         self.key_id = key_id
         self.algorithm = algorithm
@@ -546,6 +609,8 @@ class VerifyResult:
     :type algorithm: ~azure.keyvault.keys.crypto.SignatureAlgorithm
     """
 
+    __slots__ = ("key_id", "is_valid", "algorithm")
+
     def __init__(self, key_id: Optional[str], is_valid: bool, algorithm: SignatureAlgorithm) -> None:
         self.key_id = key_id
         self.is_valid = is_valid
@@ -561,6 +626,8 @@ class UnwrapResult:
     :param bytes key: The unwrapped key
     """
 
+    __slots__ = ("key_id", "algorithm", "key")
+
     def __init__(self, key_id: Optional[str], algorithm: KeyWrapAlgorithm, key: bytes) -> None:
         self.key_id = key_id
         self.algorithm = algorithm
@@ -576,6 +643,8 @@ class WrapResult:
     :param bytes encrypted_key: The encrypted key bytes
     """
 
+    __slots__ = ("key_id", "algorithm", "encrypted_key")
+
     def __init__(self, key_id: Optional[str], algorithm: KeyWrapAlgorithm, encrypted_key: bytes) -> None:
         self.key_id = key_id
         self.algorithm = algorithm
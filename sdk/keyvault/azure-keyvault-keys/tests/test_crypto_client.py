@@ -12,15 +12,18 @@ from unittest import mock
 
 from devtools_testutils import recorded_by_proxy, set_bodiless_matcher
 
+from cryptography.exceptions import InvalidSignature
 from cryptography.hazmat.primitives.hashes import SHA1, SHA256
 from cryptography.hazmat.primitives.asymmetric.padding import MGF1, OAEP, PKCS1v15
 from cryptography.hazmat.primitives.asymmetric.rsa import (
     rsa_crt_dmp1,
     rsa_crt_dmq1,
     rsa_crt_iqmp,
+    rsa_recover_prime_factors,
     RSAPrivateNumbers,
     RSAPublicNumbers
 )
+from cryptography.hazmat.primitives.asymmetric.utils import Prehashed
 from cryptography.hazmat.primitives.serialization import Encoding, NoEncryption, PrivateFormat, PublicFormat
 import pytest
 
@@ -1076,6 +1079,8 @@ def test_rsa_public_key_equals():
     assert public_key == JsonWebKey(**TEST_JWK)
     key_dupe = client.create_rsa_public_key()
     assert public_key == key_dupe
+    assert hash(public_key) == hash(key_dupe)
+    assert public_key != JsonWebKey(**dict(TEST_JWK, kid="other"))
 
 
 def test_rsa_public_key_public_bytes():
@@ -1100,6 +1105,34 @@ def test_rsa_public_key_private_key_size():
     assert public_key.key_size == private_key.key_size == 2048
 
 
+def test_rsa_public_key_built_once():
+    """Verify that KeyVaultRSAPublicKey builds its public numbers and `cryptography` key once and reuses them"""
+
+    client = CryptographyClient.from_jwk(jwk=TEST_JWK)
+    public_key = client.create_rsa_public_key()
+    assert public_key.public_numbers() is public_key.public_numbers()
+    public_key.public_bytes(Encoding.PEM, PublicFormat.PKCS1)
+    crypto_public_key = public_key._public_key
+    assert public_key.key_size == 2048
+    assert public_key._public_key is crypto_public_key
+
+
+def test_rsa_public_key_verify_prehashed():
+    """Verify that KeyVaultRSAPublicKey.verify accepts a digest with `Prehashed`"""
+
+    client = CryptographyClient.from_jwk(jwk=TEST_JWK)
+    public_key = client.create_rsa_public_key()
+    crypto_private_key = client.create_rsa_private_key().private_numbers().private_key()
+    digest = hashlib.sha256(b"message").digest()
+    signature = crypto_private_key.sign(b"message", PKCS1v15(), SHA256())
+
+    public_key.verify(signature, digest, PKCS1v15(), Prehashed(SHA256()))
+    with pytest.raises(InvalidSignature):
+        public_key.verify(signature, hashlib.sha256(b"other message").digest(), PKCS1v15(), Prehashed(SHA256()))
+    with pytest.raises(ValueError):
+        public_key.verify(signature, b"message", PKCS1v15(), Prehashed(SHA256()))
+
+
 def test_rsa_private_key_public_key():
     """Verify behavior of KeyVaultRSAPrivateKey.public_key against a JWK and KeyVaultRSAPublicKey instance"""
 
@@ -1146,6 +1179,23 @@ def test_rsa_private_key_private_bytes():
     assert private_bytes == crypto_private_bytes
 
 
+def test_rsa_private_key_built_once():
+    """Verify that KeyVaultRSAPrivateKey builds its private numbers and `cryptography` key once and reuses them"""
+
+    jwk = {k: v for k, v in TEST_JWK.items() if k not in ("p", "q")}  # prime factors must be recovered
+    client = CryptographyClient.from_jwk(jwk=jwk)
+    private_key = client.create_rsa_private_key()
+    with mock.patch(
+        "azure.keyvault.keys.crypto._models.rsa_recover_prime_factors", wraps=rsa_recover_prime_factors
+    ) as recover:
+        private_numbers = private_key.private_numbers()
+        assert private_key.private_numbers() is private_numbers
+        first = private_key.private_bytes(Encoding.PEM, PrivateFormat.TraditionalOpenSSL, NoEncryption())
+        second = private_key.private_bytes(Encoding.PEM, PrivateFormat.TraditionalOpenSSL, NoEncryption())
+    assert first == second
+    assert recover.call_count == 1
+
+
 def test_retain_url_port():
     """Regression test for https://github.com/Azure/azure-sdk-for-python/issues/24446"""
 
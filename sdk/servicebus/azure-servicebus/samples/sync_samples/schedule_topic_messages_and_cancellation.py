@@ -17,19 +17,15 @@ CONNECTION_STR = os.environ["SERVICEBUS_CONNECTION_STR"]
 TOPIC_NAME = os.environ["SERVICEBUS_TOPIC_NAME"]
 
 
-def schedule_single_message(sender):
+def schedule_single_message(sender, scheduled_time_utc):
     message = ServiceBusMessage("Message to be scheduled")
-    scheduled_time_utc = datetime.datetime.utcnow() + datetime.timedelta(seconds=30)
     sequence_number = sender.schedule_messages(message, scheduled_time_utc)
     return sequence_number
 
 
-def schedule_multiple_messages(sender):
-    messages_to_schedule = []
-    for _ in range(10):
-        messages_to_schedule.append(ServiceBusMessage("Message to be scheduled"))
+def schedule_multiple_messages(sender, scheduled_time_utc):
+    messages_to_schedule = [ServiceBusMessage("Message to be scheduled") for _ in range(10)]
 
-    scheduled_time_utc = datetime.datetime.utcnow() + datetime.timedelta(seconds=30)
     sequence_numbers = sender.schedule_messages(
         messages_to_schedule, scheduled_time_utc
     )
@@ -43,21 +39,22 @@ def main():
     with servicebus_client:
         sender = servicebus_client.get_topic_sender(topic_name=TOPIC_NAME)
         with sender:
-            sequence_number = schedule_single_message(sender)
+            scheduled_time_utc = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(seconds=30)
+            sequence_number = schedule_single_message(sender, scheduled_time_utc)
             print(
                 "Single message is scheduled and sequence number is {}".format(
                     sequence_number
                 )
             )
-            sequence_numbers = schedule_multiple_messages(sender)
+            sequence_numbers = schedule_multiple_messages(sender, scheduled_time_utc)
             print(
                 "Multiple messages are scheduled and sequence numbers are {}".format(
                     sequence_numbers
                 )
             )
 
-            sender.cancel_scheduled_messages(sequence_number)
-            sender.cancel_scheduled_messages(sequence_numbers)
+            # a single request cancels every scheduled message
+            sender.cancel_scheduled_messages([*sequence_number, *sequence_numbers])
             print("All scheduled messages are cancelled.")
 
 